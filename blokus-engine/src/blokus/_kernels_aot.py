@@ -0,0 +1,35 @@
+"""
+Ahead-of-time build of the placement kernel.
+
+JIT compilation of blokus.kernels takes far longer than the kernel itself,
+so a fresh server would stall on its first placement check. Building the
+kernel ahead of time avoids that stall and the numba runtime dependency:
+
+    python -m blokus._kernels_aot
+
+This writes a ``blokus_kernels`` extension module next to this file.
+blokus.kernels imports it first and only falls back to ``@njit`` (or plain
+Python) when it is missing. Building requires numba with ``numba.pycc``.
+"""
+
+import os
+
+from blokus.kernels import _py_fits_kernel
+
+# Must match the kernel's parameters:
+# (grid, cells, row, col, player_id, first_move, corner_row, corner_col)
+PLACEMENT_SIGNATURE = "b1(i1[:,:], i1[:,:], i8, i8, i8, b1, i8, i8)"
+
+
+def build(output_dir: str = os.path.dirname(__file__)) -> None:
+    """Compile the kernel into ``blokus_kernels`` in output_dir."""
+    from numba.pycc import CC
+
+    cc = CC("blokus_kernels")
+    cc.output_dir = output_dir
+    cc.export("check_placement", PLACEMENT_SIGNATURE)(_py_fits_kernel)
+    cc.compile()
+
+
+if __name__ == "__main__":
+    build()
@@ -0,0 +1,118 @@
+"""
+Bitboard representation of the Blokus board.
+
+A board of size N is mapped to a Python int with one bit per cell. Rows are
+N + 1 bits wide: cell (r, c) is bit r * (N + 1) + c. The extra guard column
+keeps horizontal and diagonal shifts from wrapping into the next row, so
+neighbor sets are a handful of shifts, ORs and one mask.
+
+Placement checks then become:
+- overlap:     piece & occupied == 0
+- edge rule:   piece & edges(player) == 0
+- corner rule: piece & corners(player) != 0
+"""
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+
+def stride(size: int) -> int:
+    """Bits per row (board width + guard column)."""
+    return size + 1
+
+
+def cell_bit(row: int, col: int, size: int) -> int:
+    """Single-bit mask for a cell."""
+    return 1 << (row * stride(size) + col)
+
+
+def coords_mask(coords: Iterable[Tuple[int, int]], size: int) -> int:
+    """Mask of (row, col) coordinates (assumed non-negative)."""
+    width = stride(size)
+    mask = 0
+    for r, c in coords:
+        mask |= 1 << (r * width + c)
+    return mask
+
+
+@lru_cache(maxsize=None)
+def board_mask(size: int) -> int:
+    """Mask of every cell on the board (guard column excluded)."""
+    row = (1 << size) - 1
+    width = stride(size)
+    mask = 0
+    for r in range(size):
+        mask |= row << (r * width)
+    return mask
+
+
+def grid_to_mask(cells: np.ndarray) -> int:
+    """Convert a (size, size) boolean array to a bitboard."""
+    size = cells.shape[0]
+    padded = np.zeros((size, stride(size)), dtype=bool)
+    padded[:, :size] = cells
+    return int.from_bytes(np.packbits(padded.ravel(), bitorder="little").tobytes(), "little")
+
+
+def mask_to_coords(mask: int, size: int) -> List[Tuple[int, int]]:
+    """Expand a bitboard into sorted (row, col) coordinates."""
+    width = stride(size)
+    coords = []
+    while mask:
+        low = mask & -mask
+        coords.append(divmod(low.bit_length() - 1, width))
+        mask ^= low
+    return coords
+
+
+@dataclass
+class BitBoard:
+    """
+    Bitboards derived from a Board grid.
+
+    Attributes:
+        size: Board dimension
+        occupied: Mask of all occupied cells
+        players: Mask of occupied cells per player_id
+    """
+    size: int
+    occupied: int
+    players: Dict[int, int]
+
+    _edges: Dict[int, int] = field(default_factory=dict, init=False, repr=False)
+    _corners: Dict[int, int] = field(default_factory=dict, init=False, repr=False)
+
+    @classmethod
+    def from_grid(cls, grid: np.ndarray) -> "BitBoard":
+        """Build bitboards from a grid (0 = empty, player_id + 1 = owner)."""
+        size = grid.shape[0]
+        players = {
+            player_id: grid_to_mask(grid == player_id + 1)
+            for player_id in range(4)
+        }
+        return cls(size=size, occupied=grid_to_mask(grid != 0), players=players)
+
+    def edges(self, player_id: int) -> int:
+        """In-bounds cells edge-adjacent to the player's pieces."""
+        if player_id not in self._edges:
+            own = self.players.get(player_id, 0)
+            width = stride(self.size)
+            neighbors = (own << 1) | (own >> 1) | (own << width) | (own >> width)
+            self._edges[player_id] = neighbors & board_mask(self.size) & ~own
+        return self._edges[player_id]
+
+    def corners(self, player_id: int) -> int:
+        """Empty cells diagonal to the player's pieces but not edge-adjacent."""
+        if player_id not in self._corners:
+            own = self.players.get(player_id, 0)
+            width = stride(self.size)
+            diagonals = (
+                (own << (width + 1)) | (own << (width - 1)) |
+                (own >> (width + 1)) | (own >> (width - 1))
+            )
+            free = board_mask(self.size) & ~self.occupied & ~self.edges(player_id)
+            self._corners[player_id] = diagonals & free
+        return self._corners[player_id]
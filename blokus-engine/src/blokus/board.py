@@ -7,10 +7,12 @@ Each cell can be empty (0) or occupied by a player (1-4).
 
 from dataclasses import dataclass, field
 from enum import IntEnum
+from functools import lru_cache
 from typing import List, Set, Tuple, Optional
 import numpy as np
 
 from blokus.pieces import Piece
+from blokus.bitboard import BitBoard
 
 
 class BoardCell(IntEnum):
@@ -55,28 +57,71 @@ def get_starting_corners_for_size(size: int) -> dict[int, Tuple[int, int]]:
         }
 
 
+def neighbor_masks(cells: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Edge-adjacent and diagonal neighbors of a boolean (size, size) mask.
+    
+    Both results include the input cells' own positions where neighbors
+    overlap them; callers mask those out as needed.
+    """
+    ring = np.pad(cells, 1)
+    edges = ring[:-2, 1:-1] | ring[2:, 1:-1] | ring[1:-1, :-2] | ring[1:-1, 2:]
+    diagonals = ring[:-2, :-2] | ring[:-2, 2:] | ring[2:, :-2] | ring[2:, 2:]
+    return edges, diagonals
+
+
+@lru_cache(maxsize=None)
+def zobrist_keys(size: int) -> np.ndarray:
+    """
+    Random 64-bit keys per (row, col, player_id) for Zobrist hashing.
+    
+    Seeded so fingerprints are stable across processes.
+    """
+    rng = np.random.default_rng(0xB10C05 + size)
+    keys = rng.integers(0, 2**63, size=(size, size, 4), dtype=np.uint64)
+    keys.flags.writeable = False
+    return keys
+
+
 @dataclass
 class Board:
     """
     Represents the Blokus game board.
     
     Attributes:
-        grid: 2D numpy array where 0=empty, 1-4=player occupying
+        grid: 2D numpy array where 0=empty, 1-4=player occupying. A grid
+            passed in is copied (as int8) into grid_flat, so later writes
+            to the caller's array do not reach the board
+        grid_flat: Row-major bytes backing grid (cell (r, c) at r * size + c)
         size: Board dimension (default 20)
         starting_corners: Dict mapping player_id to starting corner position
     """
     size: int = BOARD_SIZE
     grid: np.ndarray = field(default=None)
     starting_corners: dict = field(default=None)
+    grid_flat: bytearray = field(default=None, init=False, repr=False, compare=False)
     
-    # Cache for player metadata
-    _cells_cache: dict[int, Set[Tuple[int, int]]] = field(default_factory=dict, init=False, repr=False)
-    _corners_cache: dict[int, Set[Tuple[int, int]]] = field(default_factory=dict, init=False, repr=False)
-    _edges_cache: dict[int, Set[Tuple[int, int]]] = field(default_factory=dict, init=False, repr=False)
+    # Cache for player metadata (derived from grid: never part of equality)
+    _cells_cache: dict[int, Set[Tuple[int, int]]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _corners_cache: dict[int, Set[Tuple[int, int]]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _edges_cache: dict[int, Set[Tuple[int, int]]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _bitboard_cache: Optional[BitBoard] = field(default=None, init=False, repr=False, compare=False)
+    _zobrist_cache: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+    _list_cache: Optional[List[List[int]]] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
+        # One byte per cell: a 20x20 board fits in a few cache lines.
+        # grid is a view of grid_flat, so writes through either stay in sync.
         if self.grid is None:
-            self.grid = np.zeros((self.size, self.size), dtype=np.int8)
+            self.grid_flat = bytearray(self.size * self.size)
+        else:
+            if np.shape(self.grid) != (self.size, self.size):
+                raise ValueError(
+                    f"grid shape {np.shape(self.grid)} does not match board size "
+                    f"({self.size}, {self.size})"
+                )
+            self.grid_flat = bytearray(np.ascontiguousarray(self.grid, dtype=np.int8).tobytes())
+        self.grid = np.frombuffer(self.grid_flat, dtype=np.int8).reshape(self.size, self.size)
         if self.starting_corners is None:
             self.starting_corners = get_starting_corners_for_size(self.size)
         self.clear_cache()
@@ -86,14 +131,63 @@ class Board:
         self._cells_cache = {}
         self._corners_cache = {}
         self._edges_cache = {}
+        self._bitboard_cache = None
+        self._zobrist_cache = None
+        self._list_cache = None
+        
+    @property
+    def bitboard(self) -> BitBoard:
+        """Bitboards of the grid (cached until the next clear_cache())."""
+        if self._bitboard_cache is None:
+            self._bitboard_cache = BitBoard.from_grid(self.grid)
+        return self._bitboard_cache
+    
+    # Boards are mutable: key positions on zobrist, not on the board itself
+    __hash__ = None
+    
+    def __eq__(self, other: object) -> bool:
+        """Boards are equal when size and grid contents match."""
+        if not isinstance(other, Board):
+            return NotImplemented
+        return self.size == other.size and self.grid_flat == other.grid_flat
+    
+    @property
+    def zobrist(self) -> int:
+        """
+        Zobrist fingerprint: XOR of the keys of every occupied cell.
+        
+        Updated incrementally by place_piece(); recomputed from the grid
+        after any other clear_cache().
+        """
+        if self._zobrist_cache is None:
+            rows, cols = np.nonzero(self.grid)
+            owners = self.grid[rows, cols].astype(np.intp) - 1
+            keys = zobrist_keys(self.size)[rows, cols, owners]
+            self._zobrist_cache = int(np.bitwise_xor.reduce(keys, initial=np.uint64(0)))
+        return self._zobrist_cache
+    
+    def to_list(self) -> List[List[int]]:
+        """
+        Grid as nested Python lists (for serialization).
         
+        Cached until the next clear_cache(); callers must not mutate it.
+        """
+        if self._list_cache is None:
+            self._list_cache = self.grid.tolist()
+        return self._list_cache
+    
     def copy(self) -> "Board":
         """Create a deep copy of the board."""
         new_board = Board(size=self.size, starting_corners=self.starting_corners.copy())
-        new_board.grid = self.grid.copy()
+        # Single memmove into the new buffer; grid views it already
+        new_board.grid_flat[:] = self.grid_flat
         # No need to copy cache, it will rebuild on demand
         return new_board
     
+    def __deepcopy__(self, memo) -> "Board":
+        # A generic deepcopy would detach grid from grid_flat
+        return self.copy()
+    
     def get_starting_corners(self, player_id: int) -> Set[Tuple[int, int]]:
         """Get starting corner position(s) for a player."""
         if player_id in self.starting_corners:
@@ -136,13 +230,17 @@ class Board:
             if not self.is_valid_position(r, c) or not self.is_empty(r, c):
                 return False
         
-        # Place the piece
+        # Place the piece, folding its cells into the fingerprint as we go
+        zobrist = self.zobrist
+        keys = zobrist_keys(self.size)
         for r, c in positions:
             # Convert 0-indexed player_id to 1-indexed BoardCell
             self.grid[r, c] = BoardCell(player_id + 1)
+            zobrist ^= int(keys[r, c, player_id])
         
         # Invalidate cache
         self.clear_cache()
+        self._zobrist_cache = zobrist
         
         return True
     
@@ -172,27 +270,10 @@ class Board:
             self._corners_cache[player_id] = corners
             return corners
         
-        corners: Set[Tuple[int, int]] = set()
-        
-        for r, c in player_cells:
-            # Check diagonal neighbors
-            for dr, dc in [(-1, -1), (-1, 1), (1, -1), (1, 1)]:
-                nr, nc = r + dr, c + dc
-                if not self.is_valid_position(nr, nc):
-                    continue
-                if not self.is_empty(nr, nc):
-                    continue
-                    
-                # Check it's not edge-adjacent to any of player's pieces
-                is_edge_adjacent = False
-                for er, ec in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                    adj_r, adj_c = nr + er, nc + ec
-                    if (adj_r, adj_c) in player_cells:
-                        is_edge_adjacent = True
-                        break
-                
-                if not is_edge_adjacent:
-                    corners.add((nr, nc))
+        own = self.grid == player_id + 1
+        edges, diagonals = neighbor_masks(own)
+        free = diagonals & ~edges & (self.grid == 0)
+        corners = {(int(r), int(c)) for r, c in np.argwhere(free)}
         
         self._corners_cache[player_id] = corners
         return corners
@@ -202,14 +283,9 @@ class Board:
         if player_id in self._edges_cache:
             return self._edges_cache[player_id]
             
-        player_cells = self.get_player_cells(player_id)
-        edges: Set[Tuple[int, int]] = set()
-        
-        for r, c in player_cells:
-            for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                nr, nc = r + dr, c + dc
-                if self.is_valid_position(nr, nc) and (nr, nc) not in player_cells:
-                    edges.add((nr, nc))
+        own = self.grid == player_id + 1
+        edge_mask, _ = neighbor_masks(own)
+        edges = {(int(r), int(c)) for r, c in np.argwhere(edge_mask & ~own)}
         
         self._edges_cache[player_id] = edges
         return edges
@@ -1,14 +1,19 @@
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import List, Optional, Tuple, Set
+from typing import FrozenSet, List, Optional, Tuple, Set
 from enum import Enum
 import numpy as np
 
-from blokus.pieces import Piece, PieceType, PIECES, get_piece
+from blokus.pieces import Piece, PieceType, PIECES, get_piece, FULL_PIECE_SET
 from blokus.board import Board, BOARD_SIZE
 from blokus.player import Player
+from blokus.player_types import PlayerStatus
 from blokus.player_factory import PlayerFactory
 from blokus.game_manager import GameManager
-from blokus.rules import is_valid_placement, get_valid_placements, has_valid_move, get_placement_rejection_reason
+from blokus.rules import (
+    is_valid_placement, get_valid_placements,
+    find_valid_placements, get_placement_rejection_reason,
+)
 
 
 class GameStatus(Enum):
@@ -38,6 +43,11 @@ class Game:
     Handles game state, turns, move validation, and scoring.
     Now uses GameManager for player and turn management.
     """
+    # Legal-move lists kept per game (suggest -> move hits the same position)
+    LEGAL_MOVES_CACHE_SIZE = 8
+    # Placement verdicts kept per game (validate -> play checks the same move)
+    PLACEMENT_CACHE_SIZE = 1024
+    
     def __init__(
         self, 
         num_players: int = 4,
@@ -62,6 +72,15 @@ class Game:
             # Create default players with GameManager
             default_players = PlayerFactory.create_standard_players(num_players)
             self.game_manager = GameManager(default_players, starting_player_idx)
+        
+        # Cache keys start with the grid bytes rather than board.zobrist: only
+        # place_piece() keeps the fingerprint current, direct grid writes don't
+        # (grid, player_id, is_first, remaining) -> (moves, move keys)
+        self._legal_moves_cache: OrderedDict[
+            tuple, Tuple[Tuple[Move, ...], FrozenSet[tuple]]
+        ] = OrderedDict()
+        # (grid, player_id, is_first, piece_type, orientation, row, col) -> reason
+        self._placement_cache: OrderedDict[tuple, Optional[str]] = OrderedDict()
     
     # Convenience properties for backward compatibility
     @property
@@ -105,25 +124,48 @@ class Game:
         """
         if player_id is None:
             player_id = self.current_player_idx
-        
+        return list(self._legal_moves(player_id)[0])
+    
+    def _legal_moves_key(self, player_id: int) -> tuple:
+        """Cache key identifying everything legal moves depend on."""
+        return (
+            bytes(self.board.grid_flat),
+            player_id,
+            self.is_first_move(player_id),
+            self.players[player_id].remaining_mask,
+        )
+    
+    def _legal_moves(self, player_id: int) -> Tuple[Tuple[Move, ...], FrozenSet[tuple]]:
+        """Enumerate legal moves through a small LRU cache."""
+        key = self._legal_moves_key(player_id)
+        cache = self._legal_moves_cache
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+        
+        moves = tuple(self._enumerate_valid_moves(player_id))
+        entry = (moves, frozenset((m.piece_type, m.orientation, m.row, m.col) for m in moves))
+        cache[key] = entry
+        if len(cache) > self.LEGAL_MOVES_CACHE_SIZE:
+            cache.popitem(last=False)
+        return entry
+    
+    def _enumerate_valid_moves(self, player_id: int) -> List[Move]:
+        """Scan every remaining piece/orientation for legal placements."""
         player = self.players[player_id]
         is_first = self.is_first_move(player_id)
-        valid_moves: List[Move] = []
-        
-        for piece_type in player.remaining_pieces:
-            # Iterate over all pre-calculated orientations for this piece type
-            for piece in PIECES[piece_type]:
-                positions = get_valid_placements(self.board, piece, player_id, is_first)
-                for row, col in positions:
-                    valid_moves.append(Move(
-                        player_id=player_id,
-                        piece_type=piece_type,
-                        orientation=piece.orientation_id,
-                        row=row,
-                        col=col
-                    ))
-        
-        return valid_moves
+        pieces = [piece for piece_type in player.remaining_pieces for piece in PIECES[piece_type]]
+        
+        return [
+            Move(
+                player_id=player_id,
+                piece_type=pieces[k].piece_type,
+                orientation=pieces[k].orientation_id,
+                row=row,
+                col=col
+            )
+            for k, row, col in find_valid_placements(self.board, pieces, player_id, is_first).tolist()
+        ]
     
     def get_move_rejection_reason(self, move: Move) -> Optional[str]:
         """
@@ -148,14 +190,31 @@ class Game:
         if move.player_id != self.current_player_idx:
             return f"Not player {move.player_id}'s turn (current: {self.current_player_idx})"
         
-        piece = move.get_piece()
+        # Already enumerated for this position (e.g. by an AI suggestion)?
+        cached = self._legal_moves_cache.get(self._legal_moves_key(move.player_id))
+        if cached is not None and (move.piece_type, move.orientation, move.row, move.col) in cached[1]:
+            return None
+        
+        return self._placement_rejection_reason(move)
+    
+    def _placement_rejection_reason(self, move: Move) -> Optional[str]:
+        """Board-rule verdict for a move, memoized per position."""
         is_first = self.is_first_move(move.player_id)
+        key = (
+            bytes(self.board.grid_flat), move.player_id, is_first,
+            move.piece_type, move.orientation, move.row, move.col,
+        )
+        cache = self._placement_cache
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
         
-        placement_reason = get_placement_rejection_reason(self.board, piece, move.row, move.col, move.player_id, is_first)
-        if placement_reason:
-            return placement_reason
-            
-        return None
+        piece = move.get_piece()
+        reason = get_placement_rejection_reason(self.board, piece, move.row, move.col, move.player_id, is_first)
+        cache[key] = reason
+        if len(cache) > self.PLACEMENT_CACHE_SIZE:
+            cache.popitem(last=False)
+        return reason
 
     def is_valid_move(self, move: Move) -> bool:
         """Check if a move is valid."""
@@ -185,8 +244,7 @@ class Game:
             return False
             
         # Update player state
-        player.remaining_pieces.remove(move.piece_type)
-        player.last_piece_was_monomino = (move.piece_type == PieceType.I1)
+        player.play_piece(move.piece_type)
         
         # Record move
         self.move_history.append(move)
@@ -222,6 +280,69 @@ class Game:
         self.current_player.has_passed = True
         self._next_turn()
     
+    def skip_to_player(self, target_idx: int) -> None:
+        """
+        Fast-forward to a player, passing everyone in between.
+        
+        Every player from the current one up to (excluding) target_idx is
+        marked as passed in one sweep, without the per-turn valid-move
+        checks done by pass_turn().
+        
+        Args:
+            target_idx: Index of the player who should play next
+        
+        Raises:
+            ValueError: If target_idx is invalid or that player has passed
+        """
+        if not (0 <= target_idx < self.num_players):
+            raise ValueError(
+                f"target_idx must be between 0 and {self.num_players - 1}, got {target_idx}"
+            )
+        target = self.players[target_idx]
+        if target.has_passed:
+            raise ValueError(f"Player {target_idx} has already passed")
+        
+        manager = self.game_manager
+        idx = manager.current_player_index
+        while idx != target_idx:
+            self.players[idx].pass_turn()
+            manager.turn_history.append(idx)
+            idx = (idx + 1) % self.num_players
+        
+        manager.current_player_index = target_idx
+        target.status = PlayerStatus.PLAYING
+    
+    def reset_in_place(self, starting_player_idx: int = 0) -> None:
+        """
+        Restart the game with the same board size and players.
+        
+        Clears the existing board buffer and resets the Player objects
+        instead of allocating a new Board, players and GameManager.
+        
+        Args:
+            starting_player_idx: Index of the player who moves first
+        
+        Raises:
+            ValueError: If starting_player_idx is invalid
+        """
+        self.board.grid.fill(0)
+        self.board.clear_cache()
+        self.move_history = []
+        self.status = GameStatus.IN_PROGRESS
+        
+        for player in self.players:
+            player.remaining_pieces = FULL_PIECE_SET
+            player.has_passed = False
+            player.last_piece_was_monomino = False
+            player.status = PlayerStatus.WAITING
+            player.score = 0
+        
+        self.game_manager.game_finished = False
+        self.game_manager.set_starting_player_by_index(starting_player_idx)
+        
+        self._legal_moves_cache.clear()
+        self._placement_cache.clear()
+    
     def _next_turn(self) -> None:
         """Advance to next player using GameManager."""
         # Check if game is over
@@ -314,7 +435,7 @@ class Game:
                 color=p.color,
                 type=p.type,
                 persona=p.persona,
-                remaining_pieces=p.remaining_pieces.copy(),
+                remaining_pieces=p.remaining_pieces,
                 has_passed=p.has_passed,
                 last_piece_was_monomino=p.last_piece_was_monomino,
                 status=p.status,
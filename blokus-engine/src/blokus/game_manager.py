@@ -8,12 +8,16 @@ Follows SOLID principles:
 """
 
 from dataclasses import dataclass, field
+from operator import attrgetter
 from typing import List, Optional, Dict, Any
 from blokus.player import Player
 from blokus.player_types import PlayerStatus
 
+# Sort key for score order (C-level, unlike a lambda)
+_SCORE = attrgetter("score")
 
-@dataclass
+
+@dataclass(slots=True)
 class GameManager:
     """
     Centralized manager for player order and game state.
@@ -29,6 +33,8 @@ class GameManager:
     current_player_index: int = 0
     turn_history: List[int] = field(default_factory=list)
     game_finished: bool = False
+    # Player ID -> index in players (first occurrence), see _index_of
+    _index_by_id: Dict[int, int] = field(default_factory=dict, repr=False, compare=False)
     
     def __init__(self, players: List[Player] | None = None, starting_player_index: int = 0) -> None:
         """
@@ -42,6 +48,7 @@ class GameManager:
             ValueError: If starting_player_index is invalid
         """
         self.players = players or []
+        self._index_by_id = {}
         self.turn_history = []
         self.game_finished = False
         
@@ -96,10 +103,25 @@ class GameManager:
         Returns:
             Player instance or None if not found
         """
-        for player in self.players:
-            if player.id == player_id:
-                return player
-        return None
+        index = self._index_of(player_id)
+        return None if index is None else self.players[index]
+    
+    def _index_of(self, player_id: int) -> Optional[int]:
+        """
+        Index of the first player with player_id, or None.
+        
+        The id -> index map is rebuilt whenever a lookup misses or points at
+        another player, so reassigning or appending to players is picked up.
+        """
+        players = self.players
+        index = self._index_by_id.get(player_id)
+        if index is not None and index < len(players) and players[index].id == player_id:
+            return index
+        
+        self._index_by_id = {}
+        for i, player in enumerate(players):
+            self._index_by_id.setdefault(player.id, i)
+        return self._index_by_id.get(player_id)
     
     def get_player_index(self, player: Player) -> int:
         """
@@ -135,27 +157,30 @@ class GameManager:
         if not self.players:
             raise ValueError("No players in game")
         
+        players = self.players
+        n = len(players)
+        idx = self.current_player_index
+        
         # Mark current player as waiting
-        self.current_player.status = PlayerStatus.WAITING
+        players[idx].status = PlayerStatus.WAITING
         
         # Add to history
-        self.turn_history.append(self.current_player_index)
+        self.turn_history.append(idx)
         
         # Find next active player
-        attempts = 0
-        while attempts < len(self.players):
-            self.current_player_index = (self.current_player_index + 1) % len(self.players)
-            next_player = self.players[self.current_player_index]
-            
+        for _ in range(n):
+            idx += 1
+            if idx == n:
+                idx = 0
+            next_player = players[idx]
             if not next_player.has_passed:
+                self.current_player_index = idx
                 next_player.status = PlayerStatus.PLAYING
                 return next_player
-            
-            attempts += 1
         
-        # All players have passed
+        # All players have passed (a full lap ends back on the current one)
         self.game_finished = True
-        return self.players[self.current_player_index]
+        return players[idx]
     
     def set_starting_player(self, player_id: int) -> None:
         """
@@ -167,20 +192,19 @@ class GameManager:
         Raises:
             ValueError: If player not found
         """
-        for i, player in enumerate(self.players):
-            if player.id == player_id:
-                # Reset current player status
-                self.current_player.status = PlayerStatus.WAITING
-                
-                # Change current player
-                self.current_player_index = i
-                self.current_player.status = PlayerStatus.PLAYING
-                
-                # Clear history
-                self.turn_history = []
-                return
-        
-        raise ValueError(f"Player with ID {player_id} not found")
+        index = self._index_of(player_id)
+        if index is None:
+            raise ValueError(f"Player with ID {player_id} not found")
+        
+        # Reset current player status
+        self.current_player.status = PlayerStatus.WAITING
+        
+        # Change current player
+        self.current_player_index = index
+        self.current_player.status = PlayerStatus.PLAYING
+        
+        # Clear history
+        self.turn_history = []
     
     def set_starting_player_by_index(self, index: int) -> None:
         """
@@ -230,10 +254,10 @@ class GameManager:
         if not self.players:
             return []
         
-        return (
-            self.players[self.current_player_index:] +
-            self.players[:self.current_player_index]
-        )
+        # Extend the tail slice in place: no third list from a concatenation
+        order = self.players[self.current_player_index:]
+        order += self.players[:self.current_player_index]
+        return order
     
     def get_score_order(self) -> List[Player]:
         """
@@ -242,7 +266,7 @@ class GameManager:
         Returns:
             Players sorted by score
         """
-        return sorted(self.players, key=lambda p: p.score, reverse=True)
+        return sorted(self.players, key=_SCORE, reverse=True)
     
     def get_players_by_type(self, player_type: Any) -> List[Player]:
         """
@@ -277,11 +301,21 @@ class GameManager:
         if not self.is_game_over():
             return None
         
-        scores = [(p, p.score) for p in self.players]
-        max_score = max(score for _, score in scores)
-        winners = [p for p, score in scores if score == max_score]
+        # One pass tracking the best score and whether it is shared
+        # (scores go negative, so seed with the first player)
+        players = iter(self.players)
+        winner = next(players, None)
+        if winner is None:
+            return None
+        best = winner.score
+        tie = False
+        for player in players:
+            if player.score > best:
+                winner, best, tie = player, player.score, False
+            elif player.score == best:
+                tie = True
         
-        return winners[0] if len(winners) == 1 else None
+        return None if tie else winner
     
     def get_rankings(self) -> Dict[int, int]:
         """
@@ -290,27 +324,34 @@ class GameManager:
         Returns:
             Dictionary mapping player IDs to their rank (1 = first place)
         """
-        sorted_players = self.get_score_order()
-        rankings = {}
-        
-        for rank, player in enumerate(sorted_players, 1):
-            rankings[player.id] = rank
-        
-        return rankings
+        return {player.id: rank for rank, player in enumerate(self.get_score_order(), 1)}
     
     # === SERIALIZATION (SRP: conversion) ===
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for API."""
+        """
+        Convert to dictionary for API.
+        
+        Each player is serialized once; current_player and the
+        active/finished lists share those dicts.
+        """
+        player_dicts = []
+        active = []
+        finished = []
+        for player in self.players:
+            data = player.to_dict()
+            player_dicts.append(data)
+            (finished if player.has_passed else active).append(data)
+        
         return {
-            "players": [player.to_dict() for player in self.players],
+            "players": player_dicts,
             "current_player_index": self.current_player_index,
-            "current_player": self.current_player.to_dict() if self.players else None,
+            "current_player": player_dicts[self.current_player_index] if player_dicts else None,
             "turn_history": self.turn_history,
             "game_finished": self.game_finished,
-            "player_count": self.player_count,
-            "active_players": [p.to_dict() for p in self.active_players],
-            "finished_players": [p.to_dict() for p in self.finished_players]
+            "player_count": len(player_dicts),
+            "active_players": active,
+            "finished_players": finished
         }
     
     @classmethod
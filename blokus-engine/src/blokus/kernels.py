@@ -0,0 +1,102 @@
+"""
+Optional Numba kernels for placement checks.
+
+The kernels only take NumPy arrays and ints, so Numba can compile them in
+nopython mode and release the GIL. An ahead-of-time build (see
+blokus._kernels_aot) is preferred when present; without either, they stay
+plain Python functions and rules falls back to the bitboard checks.
+"""
+
+import numpy as np
+
+# Numba is optional: compile kernels when available
+try:
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+    def njit(*args, **kwargs):  # type: ignore
+        """No-op stand-in for numba.njit."""
+        def decorate(func):
+            return func
+        return decorate
+
+
+@njit(cache=True, nogil=True, boundscheck=False, error_model="numpy")
+def fits_kernel(
+    grid: np.ndarray,
+    cells: np.ndarray,
+    row: int,
+    col: int,
+    player_id: int,
+    first_move: bool,
+    corner_row: int,
+    corner_col: int
+) -> bool:
+    """
+    Check a placement directly on the grid.
+
+    Args:
+        grid: (size, size) int8 board (0 = empty, player_id + 1 = owner)
+        cells: (n, 2) int8 piece coordinates relative to (row, col)
+        row, col: Placement origin
+        player_id: Player making the move
+        first_move: Whether the starting corner rule applies
+        corner_row, corner_col: Player's starting corner
+
+    Returns:
+        True if the placement is legal
+    """
+    size = grid.shape[0]
+    owner = player_id + 1
+    covers_corner = False
+    touches_corner = False
+
+    for i in range(cells.shape[0]):
+        r = row + cells[i, 0]
+        c = col + cells[i, 1]
+        if r < 0 or r >= size or c < 0 or c >= size:
+            return False
+        if grid[r, c] != 0:
+            return False
+        if first_move:
+            if r == corner_row and c == corner_col:
+                covers_corner = True
+            continue
+        # Edge neighbours must not be own cells
+        if r > 0 and grid[r - 1, c] == owner:
+            return False
+        if r < size - 1 and grid[r + 1, c] == owner:
+            return False
+        if c > 0 and grid[r, c - 1] == owner:
+            return False
+        if c < size - 1 and grid[r, c + 1] == owner:
+            return False
+        # At least one diagonal neighbour must be an own cell
+        if not touches_corner:
+            for dr in (-1, 1):
+                for dc in (-1, 1):
+                    rr = r + dr
+                    cc = c + dc
+                    if 0 <= rr < size and 0 <= cc < size and grid[rr, cc] == owner:
+                        touches_corner = True
+
+    return covers_corner if first_move else touches_corner
+
+
+# Undecorated source, for the ahead-of-time build
+_py_fits_kernel = getattr(fits_kernel, "py_func", fits_kernel)
+
+# Prefer the ahead-of-time build: no compile stall, no numba needed at runtime
+try:
+    from blokus.blokus_kernels import check_placement as fits_kernel  # type: ignore
+    _HAS_AOT = True
+except ImportError:
+    _HAS_AOT = False
+    if _HAS_NUMBA:
+        # Compile at import so the first API request is not compile-bound
+        fits_kernel(np.zeros((1, 1), dtype=np.int8), np.zeros((1, 2), dtype=np.int8), 0, 0, 0, True, 0, 0)
+
+# Whether fits_kernel runs compiled code (otherwise rules uses bitboards)
+KERNEL_COMPILED = _HAS_AOT or _HAS_NUMBA
@@ -5,11 +5,14 @@ Each piece is defined by its shape (coordinates relative to origin)
 and can be rotated (4 rotations) and flipped (2 states) for up to 8 orientations.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import cache, lru_cache
 from enum import Enum, IntEnum
-from typing import List, Tuple, Set, FrozenSet
+from typing import Dict, List, Optional, Tuple, Set, FrozenSet
 import numpy as np
 
+from blokus.bitboard import board_mask, coords_mask, stride
+
 
 class PieceType(Enum):
     """All 21 Blokus piece types."""
@@ -45,6 +48,15 @@ class PieceType(Enum):
     Z = "Z"
 
 
+# Name -> PieceType lookup table (faster than PieceType[name] on hot paths)
+PIECE_TYPE_BY_NAME: dict[str, PieceType] = {pt.name: pt for pt in PieceType}
+# PieceType -> name (skips the Enum descriptor lookup behind pt.name)
+PIECE_NAME_BY_TYPE: dict[PieceType, str] = {pt: pt.name for pt in PieceType}
+# Starting hand: set(FULL_PIECE_SET) copies it without iterating the enum.
+# Use it for every fresh hand so all hands share one set iteration order.
+FULL_PIECE_SET: frozenset[PieceType] = frozenset(PieceType)
+
+
 class PieceOrientation(IntEnum):
     """
     Orientation index for pieces.
@@ -146,9 +158,20 @@ def _coords_to_key(coords: FrozenSet[Tuple[int, int]]) -> str:
     return str(sorted_coords)
 
 
-def _generate_all_orientations(base_coords: List[Tuple[int, int]]) -> List[FrozenSet[Tuple[int, int]]]:
+def _generate_all_orientations(base_coords: List[Tuple[int, int]]) -> Tuple[FrozenSet[Tuple[int, int]], ...]:
     """
     Generate all unique orientations (up to 8) for a piece.
+    
+    Results are cached per normalized shape, so repeated calls return
+    the same tuple object.
+    """
+    return _orientations_of(_normalize_coords(base_coords))
+
+
+@cache
+def _orientations_of(normalized: FrozenSet[Tuple[int, int]]) -> Tuple[FrozenSet[Tuple[int, int]], ...]:
+    """
+    Generate all unique orientations of an already normalized shape.
     Must match JavaScript implementation logic to ensure index consistency.
     Order: 
     1. Original (0°)
@@ -163,7 +186,6 @@ def _generate_all_orientations(base_coords: List[Tuple[int, int]]) -> List[Froze
     seen_keys: Set[str] = set()
     orientations: List[FrozenSet[Tuple[int, int]]] = []
     
-    normalized = _normalize_coords(base_coords)
     current = normalized
     
     # 4 rotations
@@ -184,7 +206,7 @@ def _generate_all_orientations(base_coords: List[Tuple[int, int]]) -> List[Froze
             orientations.append(current)
         current = _rotate_90(current)
     
-    return orientations
+    return tuple(orientations)
 
 
 @dataclass(frozen=True)
@@ -196,10 +218,29 @@ class Piece:
         piece_type: The type of piece (I1, L3, etc.)
         coords: Frozen set of (row, col) coordinates relative to top-left
         orientation_id: Index of this orientation (0 to num_orientations-1)
+        bbox_h: Bounding-box height (derived from coords)
+        bbox_w: Bounding-box width (derived from coords)
     """
     piece_type: PieceType
     coords: FrozenSet[Tuple[int, int]]
     orientation_id: int
+    bbox_h: int = field(init=False, repr=False, compare=False)
+    bbox_w: int = field(init=False, repr=False, compare=False)
+    _matrix: np.ndarray = field(init=False, repr=False, compare=False)
+    _cells: np.ndarray = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        bbox_h = max((r for r, _ in self.coords), default=-1) + 1
+        bbox_w = max((c for _, c in self.coords), default=-1) + 1
+        object.__setattr__(self, "bbox_h", bbox_h)
+        object.__setattr__(self, "bbox_w", bbox_w)
+        # Shape is static once built: rasterize once, share a read-only buffer
+        matrix = self._build_matrix()
+        matrix.flags.writeable = False
+        object.__setattr__(self, "_matrix", matrix)
+        cells = np.array(sorted(self.coords), dtype=np.int8).reshape(-1, 2)
+        cells.flags.writeable = False
+        object.__setattr__(self, "_cells", cells)
     
     @property
     def size(self) -> int:
@@ -248,14 +289,26 @@ class Piece:
     
     def bounding_box(self) -> Tuple[int, int]:
         """Get (height, width) of bounding box."""
-        if not self.coords:
-            return (0, 0)
-        max_row = max(r for r, c in self.coords)
-        max_col = max(c for r, c in self.coords)
-        return (max_row + 1, max_col + 1)
+        return (self.bbox_h, self.bbox_w)
     
     def to_matrix(self) -> np.ndarray:
-        """Convert piece to a 2D numpy array (1 where piece exists, 0 elsewhere)."""
+        """
+        Get piece as a 2D numpy array (1 where piece exists, 0 elsewhere).
+        
+        The array is cached and read-only; copy it before modifying.
+        """
+        return self._matrix
+    
+    def cells_array(self) -> np.ndarray:
+        """
+        Get sorted coordinates as an (n, 2) int8 array.
+        
+        The array is cached and read-only; copy it before modifying.
+        """
+        return self._cells
+    
+    def _build_matrix(self) -> np.ndarray:
+        """Rasterize coords into a (height, width) int8 matrix."""
         height, width = self.bounding_box()
         matrix = np.zeros((height, width), dtype=np.int8)
         for r, c in self.coords:
@@ -284,13 +337,37 @@ def _build_pieces_dict() -> dict[PieceType, List[Piece]]:
 # Global dictionary: PieceType -> List[Piece] (all orientations)
 PIECES: dict[PieceType, List[Piece]] = _build_pieces_dict()
 
+# PieceType -> number of squares (same for every orientation)
+PIECE_SIZE_BY_TYPE: dict[PieceType, int] = {pt: PIECES[pt][0].size for pt in PieceType}
+# PieceType -> single bit (declaration order), for packing piece sets into an int
+PIECE_BIT_BY_TYPE: dict[PieceType, int] = {pt: 1 << i for i, pt in enumerate(PieceType)}
+
 
+@lru_cache(maxsize=None)
 def get_piece(piece_type: PieceType, orientation: int = 0) -> Piece:
-    """Get a specific piece with a specific orientation."""
+    """
+    Get a specific piece with a specific orientation.
+    
+    Memoized: Piece is frozen and PIECES never changes after import.
+    """
     orientations = PIECES[piece_type]
     return orientations[orientation % len(orientations)]
 
 
+@lru_cache(maxsize=None)
+def get_oriented_piece(piece_type: PieceType, orientation: int) -> Optional[Piece]:
+    """
+    Get a piece orientation without wrapping the index.
+    
+    Unlike get_piece, returns None when the piece has no such orientation
+    (e.g. orientation 5 of the O4 square). Memoized like get_piece.
+    """
+    orientations = PIECES[piece_type]
+    if 0 <= orientation < len(orientations):
+        return orientations[orientation]
+    return None
+
+
 def get_all_pieces() -> List[Piece]:
     """Get all 21 pieces in their default orientation."""
     return [orientations[0] for orientations in PIECES.values()]
@@ -299,3 +376,85 @@ def get_all_pieces() -> List[Piece]:
 def num_orientations(piece_type: PieceType) -> int:
     """Get number of unique orientations for a piece type."""
     return len(PIECES[piece_type])
+
+
+# Board size the mask tables are precomputed for (mirrors board.BOARD_SIZE,
+# which cannot be imported here without a cycle)
+MASK_BOARD_SIZE = 20
+
+
+@dataclass(frozen=True)
+class PieceMasks:
+    """
+    Every placement of one piece type on a board, as bitboards.
+    
+    Tables are indexed [orientation_id][row * size + col]; an entry is 0
+    where the piece would stick out of the board.
+    
+    Attributes:
+        piece_type: The type of piece
+        size: Board dimension the masks were built for
+        placements: Cells covered by the piece
+        edges: In-bounds cells edge-adjacent to the piece
+        diagonals: In-bounds cells diagonal (but not edge) to the piece
+        max_height: Largest bounding-box height over all orientations
+        max_width: Largest bounding-box width over all orientations
+    """
+    piece_type: PieceType
+    size: int
+    placements: Tuple[Tuple[int, ...], ...]
+    edges: Tuple[Tuple[int, ...], ...]
+    diagonals: Tuple[Tuple[int, ...], ...]
+    max_height: int
+    max_width: int
+
+
+def _build_piece_masks(piece_type: PieceType, size: int) -> PieceMasks:
+    """Shift each orientation's mask to every in-bounds origin."""
+    width = stride(size)
+    in_board = board_mask(size)
+    placements, edges, diagonals = [], [], []
+    max_height = max_width = 0
+    
+    for piece in PIECES[piece_type]:
+        height, piece_width = piece.bounding_box()
+        max_height = max(max_height, height)
+        max_width = max(max_width, piece_width)
+        cells = coords_mask(piece.coords, size)
+        # Halos reach row/col -1: build them offset by (1, 1), shift back below
+        edge_halo = coords_mask(((r + 1, c + 1) for r, c in piece.get_edges()), size)
+        diag_halo = coords_mask(((r + 1, c + 1) for r, c in piece.get_corners()), size)
+        
+        piece_placements = [0] * (size * size)
+        piece_edges = [0] * (size * size)
+        piece_diagonals = [0] * (size * size)
+        for row in range(size - height + 1):
+            for col in range(size - piece_width + 1):
+                shift = row * width + col
+                index = row * size + col
+                piece_placements[index] = cells << shift
+                piece_edges[index] = ((edge_halo << shift) >> (width + 1)) & in_board
+                piece_diagonals[index] = ((diag_halo << shift) >> (width + 1)) & in_board
+        placements.append(tuple(piece_placements))
+        edges.append(tuple(piece_edges))
+        diagonals.append(tuple(piece_diagonals))
+    
+    return PieceMasks(
+        piece_type=piece_type,
+        size=size,
+        placements=tuple(placements),
+        edges=tuple(edges),
+        diagonals=tuple(diagonals),
+        max_height=max_height,
+        max_width=max_width,
+    )
+
+
+@lru_cache(maxsize=None)
+def get_piece_masks(size: int = MASK_BOARD_SIZE) -> Dict[PieceType, PieceMasks]:
+    """Placement mask tables for every piece type on a size x size board."""
+    return {piece_type: _build_piece_masks(piece_type, size) for piece_type in PieceType}
+
+
+# Tables for the standard board, built once at import
+PIECE_MASKS: Dict[PieceType, PieceMasks] = get_piece_masks(MASK_BOARD_SIZE)
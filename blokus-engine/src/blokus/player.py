@@ -1,10 +1,10 @@
 from dataclasses import dataclass, field
-from typing import Set, Optional, Dict, Any
-from blokus.pieces import PieceType, PIECES
-from blokus.player_types import PlayerType, PlayerStatus
+from typing import FrozenSet, List, Optional, Dict, Any
+from blokus.pieces import PieceType, PIECE_NAME_BY_TYPE, PIECE_SIZE_BY_TYPE, PIECE_TYPE_BY_NAME, PIECE_BIT_BY_TYPE, FULL_PIECE_SET
+from blokus.player_types import PlayerType, PlayerStatus, PLAYER_STATUS_VALUES, PLAYER_TYPE_VALUES
 
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     """
     Unified Player class.
@@ -24,7 +24,8 @@ class Player:
     persona: Optional[str] = None
     
     # === GAME STATE (SRP: game data) ===
-    remaining_pieces: Set[PieceType] = field(default_factory=set)
+    # Immutable: replaced (not mutated) on each play, see play_piece
+    remaining_pieces: FrozenSet[PieceType] = FULL_PIECE_SET
     has_passed: bool = False
     last_piece_was_monomino: bool = False
     status: PlayerStatus = PlayerStatus.WAITING
@@ -33,10 +34,20 @@ class Player:
     score: int = 0
     turn_order: Optional[int] = None
     
+    # Sorted piece names for serialization, with the hand they list
+    _sorted_names: List[str] = field(default_factory=list, init=False, repr=False, compare=False)
+    _sorted_names_for: Optional[FrozenSet[PieceType]] = field(default=None, init=False, repr=False, compare=False)
+    # Square count and piece bitmask, with the hand they were counted for
+    _squares: int = field(default=0, init=False, repr=False, compare=False)
+    _mask: int = field(default=0, init=False, repr=False, compare=False)
+    _counted_for: Optional[FrozenSet[PieceType]] = field(default=None, init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         """Initialize pieces if necessary."""
         if not self.remaining_pieces:
-            self.remaining_pieces = set(PieceType)
+            self.remaining_pieces = FULL_PIECE_SET
+        elif not isinstance(self.remaining_pieces, frozenset):
+            self.remaining_pieces = frozenset(self.remaining_pieces)
     
     # === PROPERTIES (POLA: predictable names) ===
     @property
@@ -46,12 +57,59 @@ class Player:
     
     @property
     def squares_remaining(self) -> int:
-        """Total squares in remaining pieces."""
-        total = 0
-        for pt in self.remaining_pieces:
-            piece = PIECES[pt][0]  # Any orientation, same size
-            total += piece.size
-        return total
+        """
+        Total squares in remaining pieces.
+        
+        Kept up to date by play_piece (see _recount).
+        """
+        self._recount()
+        return self._squares
+    
+    @property
+    def remaining_mask(self) -> int:
+        """
+        Remaining pieces packed into an int (see PIECE_BIT_BY_TYPE).
+        
+        A cheap hashable stand-in for frozenset(remaining_pieces); cached
+        like squares_remaining.
+        """
+        self._recount()
+        return self._mask
+    
+    def _recount(self) -> None:
+        """
+        Recount squares and mask if remaining_pieces was reassigned.
+        
+        remaining_pieces is a frozenset, so its identity is enough to tell
+        whether the counters are current: play_piece updates them together
+        with the hand, and any other change has to assign a new hand (a
+        plain set assigned directly is frozen here first).
+        """
+        pieces = self.remaining_pieces
+        if self._counted_for is not pieces:
+            if not isinstance(pieces, frozenset):
+                pieces = self.remaining_pieces = frozenset(pieces)
+            squares = mask = 0
+            for pt in pieces:
+                squares += PIECE_SIZE_BY_TYPE[pt]
+                mask |= PIECE_BIT_BY_TYPE[pt]
+            self._squares = squares
+            self._mask = mask
+            self._counted_for = pieces
+    
+    @property
+    def remaining_piece_names(self) -> List[str]:
+        """
+        Sorted names of remaining pieces.
+        
+        Cached between calls; treat the list as read-only. Updated by
+        play_piece, rebuilt when remaining_pieces is reassigned.
+        """
+        self._recount()
+        if self._sorted_names_for is not self.remaining_pieces:
+            self._sorted_names = sorted(PIECE_NAME_BY_TYPE[pt] for pt in self.remaining_pieces)
+            self._sorted_names_for = self.remaining_pieces
+        return self._sorted_names
     
     @property
     def is_ai(self) -> bool:
@@ -82,11 +140,23 @@ class Player:
         Returns:
             True if piece was played, False otherwise
         """
-        if piece_type in self.remaining_pieces:
-            self.remaining_pieces.remove(piece_type)
-            self.last_piece_was_monomino = (piece_type == PieceType.I1)
-            return True
-        return False
+        if piece_type not in self.remaining_pieces:
+            return False
+        
+        # Carry the counters over to the new hand instead of recounting
+        self._recount()
+        old = self.remaining_pieces
+        new = self.remaining_pieces = old - {piece_type}
+        self._squares -= PIECE_SIZE_BY_TYPE[piece_type]
+        self._mask &= ~PIECE_BIT_BY_TYPE[piece_type]
+        self._counted_for = new
+        if self._sorted_names_for is old:
+            name = PIECE_NAME_BY_TYPE[piece_type]
+            self._sorted_names = [n for n in self._sorted_names if n != name]
+            self._sorted_names_for = new
+        
+        self.last_piece_was_monomino = (piece_type == PieceType.I1)
+        return True
     
     def pass_turn(self) -> None:
         """Pass this player's turn."""
@@ -122,11 +192,11 @@ class Player:
             "id": self.id,
             "name": self.name,
             "color": self.color,
-            "type": self.type.value,
+            "type": PLAYER_TYPE_VALUES[self.type],
             "persona": self.persona,
-            "remaining_pieces": sorted([pt.name for pt in self.remaining_pieces]),
+            "remaining_pieces": list(self.remaining_piece_names),
             "has_passed": self.has_passed,
-            "status": self.status.value,
+            "status": PLAYER_STATUS_VALUES[self.status],
             "score": self.score,
             "pieces_count": self.pieces_count,
             "squares_remaining": self.squares_remaining,
@@ -139,7 +209,7 @@ class Player:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Player":
         """Create Player from dictionary."""
-        pieces = {PieceType[name] for name in data.get("remaining_pieces", [])}
+        pieces = frozenset(PIECE_TYPE_BY_NAME[name] for name in data.get("remaining_pieces", []))
         
         return cls(
             id=data["id"],
@@ -24,12 +24,16 @@ class PlayerFactory:
     """
     
     # Default colors (DRY: defined once)
-    DEFAULT_COLORS = [
+    DEFAULT_COLORS = (
         "#3b82f6",  # Blue
         "#22c55e",  # Green
         "#eab308",  # Yellow
         "#ef4444"   # Red
-    ]
+    )
+    
+    # Power-of-two palette: `id & mask` wraps like `id % len` without division
+    _COLOR_MASK = len(DEFAULT_COLORS) - 1
+    assert not len(DEFAULT_COLORS) & _COLOR_MASK, "DEFAULT_COLORS size must be a power of two"
     
     @classmethod
     def create_human_player(cls, id: int, name: str, color: str | None = None) -> Player:
@@ -45,7 +49,7 @@ class PlayerFactory:
             Player instance
         """
         if color is None:
-            color = cls.DEFAULT_COLORS[id % len(cls.DEFAULT_COLORS)]
+            color = cls.DEFAULT_COLORS[id & cls._COLOR_MASK]
         
         return Player(
             id=id,
@@ -68,7 +72,7 @@ class PlayerFactory:
             Player instance
         """
         if color is None:
-            color = cls.DEFAULT_COLORS[id % len(cls.DEFAULT_COLORS)]
+            color = cls.DEFAULT_COLORS[id & cls._COLOR_MASK]
         
         ai_names = {
             "random": "Bot Aléatoire",
@@ -101,31 +105,29 @@ class PlayerFactory:
         Raises:
             ValueError: If unknown player type
         """
-        players: list[Player] = []
-        
-        for config in player_configs:
-            player_type = config.get("type", "human")
-            player_id = config.get("id", len(players))
-            color = config.get("color")
-            
-            if player_type == "human":
-                player = cls.create_human_player(
-                    player_id,
-                    config.get("name", f"Joueur {player_id + 1}"),
-                    color
-                )
-            elif player_type == "ai":
-                player = cls.create_ai_player(
-                    player_id,
-                    config.get("persona", "random"),
-                    color
-                )
-            else:
-                raise ValueError(f"Unknown player type: {player_type}")
-            
-            players.append(player)
-        
-        return players
+        return [
+            cls._create_from_config(index, config)
+            for index, config in enumerate(player_configs)
+        ]
+    
+    # Player type -> builder(cls, player_id, config, color)
+    _CONFIG_BUILDERS = {
+        "human": lambda cls, player_id, config, color: cls.create_human_player(
+            player_id, config.get("name", f"Joueur {player_id + 1}"), color
+        ),
+        "ai": lambda cls, player_id, config, color: cls.create_ai_player(
+            player_id, config.get("persona", "random"), color
+        ),
+    }
+    
+    @classmethod
+    def _create_from_config(cls, index: int, config: Dict[str, Any]) -> Player:
+        """Create one player from its config (index is the default ID)."""
+        player_type = config.get("type", "human")
+        builder = cls._CONFIG_BUILDERS.get(player_type)
+        if builder is None:
+            raise ValueError(f"Unknown player type: {player_type}")
+        return builder(cls, config.get("id", index), config, config.get("color"))
     
     @classmethod
     def create_standard_players(cls, num_players: int = 4) -> List[Player]:
@@ -24,6 +24,11 @@ class PlayerStatus(Enum):
     FINISHED = "finished"         # Game finished for this player
 
 
+# Enum -> value tables for serialization (skip the Enum .value descriptor)
+PLAYER_TYPE_VALUES: dict[PlayerType, str] = {t: t.value for t in PlayerType}
+PLAYER_STATUS_VALUES: dict[PlayerStatus, str] = {s: s.value for s in PlayerStatus}
+
+
 class GameState(Enum):
     """States of the overall game."""
     INITIALIZING = "initializing"
@@ -13,17 +13,22 @@ For 14×14 Duo: 21 × 8 × 196 = 32,928 actions
 """
 
 import numpy as np
-from typing import Optional, List, Tuple
+from typing import Optional, List, Sequence, Tuple
 from dataclasses import dataclass
 
-from blokus.game import Game, Move
-from blokus.pieces import PieceType, PIECES, get_piece
+from blokus.game import Game, Move, GameStatus
+from blokus.pieces import PieceType, get_oriented_piece, get_piece
+from blokus.rules import ORIENTATION_KEYS, placement_windows, score_placement_lanes
 from blokus.rl.encoding import ActionEncoding
 
 
 # Maximum orientations per piece (some pieces have fewer due to symmetry)
 MAX_ORIENTATIONS = ActionEncoding.NUM_ORIENTATIONS
 
+# Piece index <-> PieceType, built once (list(PieceType) per call is costly)
+_PIECE_TYPES = tuple(PieceType)
+_PIECE_INDEX = {piece_type: i for i, piece_type in enumerate(_PIECE_TYPES)}
+
 
 @dataclass
 class ActionSpaceConfig:
@@ -54,7 +59,7 @@ def encode_action(move: Move, board_size: int = 20) -> int:
     Returns:
         Integer action index
     """
-    piece_idx = list(PieceType).index(move.piece_type)
+    piece_idx = _PIECE_INDEX[move.piece_type]
     return ActionEncoding.encode(
         piece_idx=piece_idx,
         orientation=move.orientation,
@@ -81,15 +86,13 @@ def decode_action(action: int, game: Game) -> Optional[Move]:
     piece_idx, orientation, row, col = ActionEncoding.decode(action, board_size)
     
     # Validate piece index
-    piece_types = list(PieceType)
-    if piece_idx >= len(piece_types):
+    if piece_idx >= len(_PIECE_TYPES):
         return None
     
-    piece_type = piece_types[piece_idx]
+    piece_type = _PIECE_TYPES[piece_idx]
     
     # Check if this orientation exists for this piece
-    piece_variants = PIECES.get(piece_type, [])
-    if orientation >= len(piece_variants):
+    if get_oriented_piece(piece_type, orientation) is None:
         return None
     
     return Move(
@@ -127,6 +130,62 @@ def get_action_mask(game: Game) -> np.ndarray:
     return mask
 
 
+# Action-space slot (piece_idx * NUM_ORIENTATIONS + orientation) per column
+# of ORIENTATION_COLUMNS
+_COLUMN_SLOTS = np.array([
+    _PIECE_INDEX[piece_type] * MAX_ORIENTATIONS + orientation
+    for piece_type, orientation in ORIENTATION_KEYS
+])
+
+
+def get_action_masks_batched(games: Sequence[Game], validate: bool = False) -> np.ndarray:
+    """
+    Generate action masks for many games (e.g. parallel self-play) at once.
+    
+    Stacks every game's placement windows and scores all games x origins x
+    orientations with a single batched matmul, then drops pieces the
+    current player no longer holds. Finished games get an all-False row.
+    
+    Args:
+        games: Games sharing one board size
+        validate: Cross-check every row against get_action_mask (slow)
+    
+    Returns:
+        Boolean array of shape (len(games), action_space_size)
+    """
+    if not games:
+        return np.zeros((0, 0), dtype=bool)
+    board_size = games[0].board.size
+    if any(game.board.size != board_size for game in games):
+        raise ValueError("All games in a batch must share the same board size")
+    
+    spatial = board_size * board_size
+    lanes = []
+    holds = np.zeros((len(games), len(ORIENTATION_KEYS)), dtype=bool)
+    for i, game in enumerate(games):
+        if game.status != GameStatus.IN_PROGRESS:
+            lanes.append(None)
+            continue
+        player_id = game.current_player_idx
+        lanes.append(placement_windows(game.board, player_id, game.is_first_move(player_id)))
+        remaining = game.players[player_id].remaining_pieces
+        holds[i] = [piece_type in remaining for piece_type, _ in ORIENTATION_KEYS]
+    
+    # (games, origins, orientations)
+    valid = score_placement_lanes(lanes, board_size)
+    valid &= holds[:, None, :]
+    
+    masks = np.zeros((len(games), ActionEncoding.NUM_PIECES * MAX_ORIENTATIONS, spatial), dtype=bool)
+    masks[:, _COLUMN_SLOTS, :] = valid.transpose(0, 2, 1)
+    masks = masks.reshape(len(games), -1)
+    
+    if validate:
+        for i, game in enumerate(games):
+            if game.status == GameStatus.IN_PROGRESS and not np.array_equal(masks[i], get_action_mask(game)):
+                raise AssertionError(f"Batched action mask differs from get_action_mask for game {i}")
+    return masks
+
+
 def get_valid_actions(game: Game) -> List[int]:
     """
     Get list of valid action indices.
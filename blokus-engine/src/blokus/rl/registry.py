@@ -75,11 +75,21 @@ class AgentRegistry:
         
         self.registry_path = Path(registry_path)
         self._agents: Dict[str, AgentMetadata] = {}
+        # Modification time of registry.json when it was last read
+        self.loaded_mtime_ns: Optional[int] = None
         self._load_registry()
     
+    def _registry_mtime_ns(self) -> Optional[int]:
+        """Current modification time of registry.json (None if missing)."""
+        try:
+            return self.registry_path.stat().st_mtime_ns
+        except OSError:
+            return None
+    
     def _load_registry(self) -> None:
         """Load agent definitions from JSON file."""
-        if not self.registry_path.exists():
+        self.loaded_mtime_ns = self._registry_mtime_ns()
+        if self.loaded_mtime_ns is None:
             print(f"Warning: Registry file not found at {self.registry_path}")
             return
         
@@ -234,6 +244,18 @@ class AgentRegistry:
         """Reload registry from disk."""
         self._agents.clear()
         self._load_registry()
+    
+    def reload_if_changed(self) -> bool:
+        """
+        Reload registry from disk if registry.json changed since last read.
+        
+        Returns:
+            True if the registry was reloaded
+        """
+        if self._registry_mtime_ns() == self.loaded_mtime_ns:
+            return False
+        self.reload()
+        return True
 
 
 # Global singleton instance
@@ -4,10 +4,113 @@ Blokus placement rules validation.
 Validates whether a piece can be placed at a given position on the board.
 """
 
-from typing import Set, Tuple, Optional
+from typing import List, Sequence, Set, Tuple, Optional
 
-from blokus.pieces import Piece
-from blokus.board import Board, STARTING_CORNERS
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from blokus.pieces import PIECES, Piece, PieceType, get_piece_masks
+from blokus.board import Board, STARTING_CORNERS, neighbor_masks
+from blokus.bitboard import cell_bit
+from blokus.kernels import KERNEL_COMPILED, fits_kernel
+
+
+# Every orientation rasterized into a flat WINDOW x WINDOW column, so a single
+# matmul scores all (origin, orientation) pairs at once
+WINDOW = 5
+
+
+def _build_orientation_columns() -> Tuple[np.ndarray, List[Tuple[PieceType, int]]]:
+    """(WINDOW * WINDOW, n_orientations) float32 matrix + (type, orientation) per column."""
+    all_pieces = [piece for orientations in PIECES.values() for piece in orientations]
+    columns = np.zeros((len(all_pieces), WINDOW, WINDOW), dtype=np.float32)
+    for k, piece in enumerate(all_pieces):
+        matrix = piece.to_matrix()
+        columns[k, :matrix.shape[0], :matrix.shape[1]] = matrix
+    keys = [(piece.piece_type, piece.orientation_id) for piece in all_pieces]
+    return columns.reshape(len(all_pieces), WINDOW * WINDOW).T.copy(), keys
+
+
+ORIENTATION_COLUMNS, ORIENTATION_KEYS = _build_orientation_columns()
+_ORIENTATION_INDEX = {key: k for k, key in enumerate(ORIENTATION_KEYS)}
+
+
+def placement_windows(
+    board: Board,
+    player_id: int,
+    is_first_move: bool = False
+) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Sliding-window views of the "forbidden" and "anchor" planes.
+    
+    Forbidden cells are occupied or edge-adjacent to own cells (and padded as
+    forbidden past the board); anchors are own diagonal corners, or the
+    starting corner on a first move. Multiplying either result by
+    ORIENTATION_COLUMNS counts, per (origin, orientation), the piece cells
+    landing on such cells.
+    
+    Returns:
+        Two (size * size, WINDOW * WINDOW) float32 arrays, or None if the
+        player has no starting corner
+    """
+    size = board.size
+    grid = board.grid
+    own = grid == player_id + 1
+    anchors = np.zeros((size + WINDOW - 1, size + WINDOW - 1), dtype=np.float32)
+    
+    if is_first_move or not own.any():
+        starting_corner = board.starting_corners.get(player_id) or STARTING_CORNERS.get(player_id)
+        if starting_corner is None:
+            return None
+        forbidden = grid != 0
+        anchors[starting_corner] = 1
+    else:
+        edges, diagonals = neighbor_masks(own)
+        forbidden = (grid != 0) | edges
+        anchors[:size, :size] = diagonals & ~forbidden
+    
+    blocked = np.pad(forbidden, (0, WINDOW - 1), constant_values=True).astype(np.float32)
+    
+    def windows(plane: np.ndarray) -> np.ndarray:
+        return sliding_window_view(plane, (WINDOW, WINDOW))[:size, :size].reshape(size * size, -1)
+    
+    return windows(blocked), windows(anchors)
+
+
+def _fits(
+    board: Board,
+    piece: Piece,
+    row: int,
+    col: int,
+    player_id: int,
+    is_first_move: bool
+) -> bool:
+    """Bitboard placement check (same rules as get_placement_rejection_reason)."""
+    if KERNEL_COMPILED:
+        first_move = is_first_move or not board.get_player_cells(player_id)
+        corner = board.starting_corners.get(player_id) or STARTING_CORNERS.get(player_id) or (-1, -1)
+        return fits_kernel(
+            board.grid, piece.cells_array(), int(row), int(col),
+            player_id, first_move, corner[0], corner[1]
+        )
+    
+    size = board.size
+    # Bounding-box prefilter: most off-board candidates stop here
+    if (row | col) < 0 or row + piece.bbox_h > size or col + piece.bbox_w > size:
+        return False
+    mask = get_piece_masks(size)[piece.piece_type].placements[piece.orientation_id][row * size + col]
+    
+    bits = board.bitboard
+    if mask & bits.occupied:
+        return False
+    
+    if is_first_move or not bits.players.get(player_id, 0):
+        starting_corner = board.starting_corners.get(player_id) or STARTING_CORNERS.get(player_id)
+        if starting_corner is None:
+            return False
+        return bool(mask & cell_bit(starting_corner[0], starting_corner[1], size))
+    
+    return not (mask & bits.edges(player_id)) and bool(mask & bits.corners(player_id))
 
 
 def get_placement_rejection_reason(
@@ -22,6 +125,10 @@ def get_placement_rejection_reason(
     Check if a piece can be placed and return reason if not.
     Returns None if placement is valid.
     """
+    # Fast path: valid placements never need the detailed checks below
+    if _fits(board, piece, row, col, player_id, is_first_move):
+        return None
+    
     # Get absolute positions
     # positions = piece.translate(row, col) # Avoid list creation if possible
     
@@ -75,7 +182,7 @@ def is_valid_placement(
     """
     Check if a piece can be placed at the given position.
     """
-    return get_placement_rejection_reason(board, piece, row, col, player_id, is_first_move) is None
+    return _fits(board, piece, row, col, player_id, is_first_move)
 
 
 def get_valid_placements(
@@ -127,6 +234,63 @@ def get_valid_placements(
     return valid_positions
 
 
+def score_placement_lanes(
+    lanes: Sequence[Optional[Tuple[np.ndarray, np.ndarray]]],
+    size: int
+) -> np.ndarray:
+    """
+    Score several placement_windows() results in one batched matmul.
+    
+    Each lane is one (board, player) pair; None lanes (no starting corner)
+    score as all-invalid.
+    
+    Returns:
+        Boolean (lanes, size * size, n_orientations) validity array, columns
+        in ORIENTATION_KEYS order
+    """
+    window_cells = ORIENTATION_COLUMNS.shape[0]
+    blocked = np.ones((len(lanes), size * size, window_cells), dtype=np.float32)
+    anchors = np.zeros((len(lanes), size * size, window_cells), dtype=np.float32)
+    for i, planes in enumerate(lanes):
+        if planes is not None:
+            blocked[i], anchors[i] = planes
+    return ((blocked @ ORIENTATION_COLUMNS) == 0) & ((anchors @ ORIENTATION_COLUMNS) > 0)
+
+
+def find_valid_placements(
+    board: Board,
+    pieces: Sequence[Piece],
+    player_id: int,
+    is_first_move: bool = False
+) -> np.ndarray:
+    """
+    Get valid positions for many pieces at once, vectorized over the board.
+    
+    Scores every origin against every piece with one matmul over the
+    placement_windows() planes.
+    
+    Args:
+        board: Current board state
+        pieces: Pieces (orientations) to check
+        player_id: Player making the move
+        is_first_move: Whether this is the player's first move
+    
+    Returns:
+        (n, 3) int array of (index into pieces, row, col), ordered by piece
+        then row then col
+    """
+    planes = placement_windows(board, player_id, is_first_move)
+    if planes is None:
+        return np.empty((0, 3), dtype=np.intp)
+    blocked, anchors = planes
+    columns = ORIENTATION_COLUMNS[:, [_ORIENTATION_INDEX[(p.piece_type, p.orientation_id)] for p in pieces]]
+    
+    size = board.size
+    valid = ((blocked @ columns) == 0) & ((anchors @ columns) > 0)
+    piece_idx, origin = np.nonzero(valid.T)
+    return np.column_stack((piece_idx, origin // size, origin % size))
+
+
 def has_valid_move(board: Board, pieces: list[Piece], player_id: int, is_first_move: bool = False) -> bool:
     """
     Check if a player has any valid moves with their remaining pieces.
@@ -140,7 +304,4 @@ def has_valid_move(board: Board, pieces: list[Piece], player_id: int, is_first_m
     Returns:
         True if at least one valid move exists
     """
-    for piece in pieces:
-        if get_valid_placements(board, piece, player_id, is_first_move):
-            return True
-    return False
+    return len(find_valid_placements(board, pieces, player_id, is_first_move)) > 0
@@ -1 +1,64 @@
 """Test configuration."""
+
+import os
+import random
+from typing import Optional
+
+import pytest
+from hypothesis import settings
+
+from blokus.game import Game, Move
+from blokus.game_manager_factory import GameManagerFactory
+
+
+# Hypothesis profiles: select with HYP_PROFILE (CI uses "ci", "fast" is
+# an opt-in smoke run). No deadlines: cold NumPy/Numba warmup would flake.
+settings.register_profile("fast", max_examples=5, deadline=None)
+settings.register_profile("dev", deadline=None)
+settings.register_profile("ci", max_examples=200, deadline=None)
+settings.load_profile(os.environ.get("HYP_PROFILE", "dev"))
+
+
+def sample_valid_move(game: Game, rng=random) -> Optional[Move]:
+    """
+    Random valid move for the current player, or None if it has none.
+    
+    Moves are sorted before picking, so the choice depends only on the rng
+    state (not on set iteration order).
+    """
+    moves = game.get_valid_moves()
+    if not moves:
+        return None
+    moves.sort(key=lambda m: (m.piece_type.value, m.orientation, m.row, m.col))
+    return rng.choice(moves)
+
+
+@pytest.fixture(scope="session")
+def mixed_4p_config():
+    """Standard 4P configuration: 1 Human, 3 AI (shared, read-only)."""
+    return (
+        {"id": 0, "name": "Human", "type": "human"},
+        {"id": 1, "name": "AI 1", "type": "ai", "persona": "random"},
+        {"id": 2, "name": "AI 2", "type": "ai", "persona": "random"},
+        {"id": 3, "name": "AI 3", "type": "ai", "persona": "random"},
+    )
+
+
+@pytest.fixture
+def fresh_game(mixed_4p_config):
+    """Fresh mixed 4P game built from the shared configuration."""
+    gm = GameManagerFactory.create_from_config(list(mixed_4p_config))
+    return Game(game_manager=gm)
+
+
+@pytest.fixture(scope="session")
+def pristine_games():
+    """
+    Untouched games keyed by (num_players, starting_player_idx).
+    
+    Never mutate these directly: call .copy() first.
+    """
+    return {
+        (n, i): Game(num_players=n, starting_player_idx=i)
+        for n in (2, 4) for i in range(n)
+    }
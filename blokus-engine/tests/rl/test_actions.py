@@ -0,0 +1,45 @@
+"""Tests for RL action masks."""
+
+import random
+
+import numpy as np
+import pytest
+from blokus.board import Board
+from blokus.game import Game
+from blokus.rl.actions import get_action_mask, get_action_masks_batched
+
+from conftest import sample_valid_move
+
+
+def _played_game(seed: int, num_players: int = 4) -> Game:
+    """Game advanced by a few seeded random moves."""
+    game = Game(num_players=num_players)
+    rng = random.Random(seed)
+    for _ in range(seed * 2):
+        move = sample_valid_move(game, rng)
+        if move is None:
+            game.force_pass()
+        else:
+            game.play_move(move)
+    return game
+
+
+class TestBatchedActionMask:
+    """Test get_action_masks_batched against the per-game mask."""
+    
+    def test_matches_per_game_masks(self):
+        """Each batched row equals get_action_mask for that game."""
+        games = [_played_game(seed) for seed in range(6)]
+        
+        masks = get_action_masks_batched(games)
+        
+        assert masks.shape == (6, get_action_mask(games[0]).size)
+        for game, mask in zip(games, masks):
+            assert np.array_equal(mask, get_action_mask(game))
+    
+    def test_mixed_board_sizes_rejected(self):
+        """Games in a batch must share a board size."""
+        games = [Game(num_players=2), Game(num_players=2, board=Board(size=14))]
+        
+        with pytest.raises(ValueError, match="same board size"):
+            get_action_masks_batched(games)
@@ -95,6 +95,21 @@ class TestAgentRegistry:
         assert len(registry._agents) == 1
         assert "new" in registry._agents
 
+    def test_reload_if_changed(self, temp_registry_file):
+        """Should only reload when registry.json's mtime moves."""
+        import os
+        registry = AgentRegistry(temp_registry_file)
+        assert not registry.reload_if_changed()
+        
+        with open(temp_registry_file, "w", encoding="utf-8") as f:
+            json.dump([], f)
+        stat = temp_registry_file.stat()
+        os.utime(temp_registry_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        
+        assert registry.reload_if_changed()
+        assert registry._agents == {}
+        assert not registry.reload_if_changed()
+
     def test_load_agent_model_invalid_file(self, temp_registry_file):
         """Should attempt to load model and fail on invalid file (proving implementation exists)."""
         with open(temp_registry_file, "r") as f:
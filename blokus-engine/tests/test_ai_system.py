@@ -90,7 +90,7 @@ class TestPlayerValidation:
 
         # Simulate placing a piece
         piece_type = list(player.remaining_pieces)[0]
-        player.remaining_pieces.discard(piece_type)
+        player.remaining_pieces = player.remaining_pieces - {piece_type}
 
         assert len(player.remaining_pieces) == initial_count - 1
 
@@ -109,7 +109,7 @@ class TestPlayerValidation:
 
         # Modify player1
         piece_type = list(player1.remaining_pieces)[0]
-        player1.remaining_pieces.discard(piece_type)
+        player1.remaining_pieces = player1.remaining_pieces - {piece_type}
         player1.has_passed = True
 
         # Check player2 is unaffected
@@ -250,7 +250,7 @@ class TestGameCopy:
 
         # Modify original player's pieces
         piece_type = list(self.game.players[0].remaining_pieces)[0]
-        self.game.players[0].remaining_pieces.discard(piece_type)
+        self.game.players[0].remaining_pieces = self.game.players[0].remaining_pieces - {piece_type}
 
         # Original should have fewer pieces
         assert len(self.game.players[0].remaining_pieces) == initial_pieces - 1
@@ -290,7 +290,7 @@ class TestGameScoring:
         # Simulate placing a piece (removing from remaining)
         player = self.game.players[0]
         piece_type = list(player.remaining_pieces)[0]
-        player.remaining_pieces.discard(piece_type)
+        player.remaining_pieces = player.remaining_pieces - {piece_type}
 
         new_scores = self.game.get_scores()
 
@@ -350,7 +350,7 @@ class TestErrorHandling:
         """Test handling of player with no remaining pieces"""
         player = self.game.players[0]
         # Clear all pieces
-        player.remaining_pieces.clear()
+        player.remaining_pieces = frozenset()
 
         assert len(player.remaining_pieces) == 0
 
@@ -4,6 +4,7 @@ import pytest
 import numpy as np
 from blokus.board import Board, BOARD_SIZE, STARTING_CORNERS
 from blokus.pieces import get_piece, PieceType
+from blokus.bitboard import mask_to_coords
 
 
 class TestBoardBasics:
@@ -21,6 +22,27 @@ class TestBoardBasics:
         assert board.count_occupied() == 0
         assert np.all(board.grid == 0)
     
+    def test_grid_is_int8(self):
+        """Grid uses one byte per cell, even when built from another dtype."""
+        assert Board().grid.dtype == np.int8
+        assert Board(size=3, grid=np.eye(3, dtype=np.int64)).grid.dtype == np.int8
+        assert Board().copy().grid.dtype == np.int8
+    
+    def test_grid_argument_is_copied(self):
+        """A grid passed in is copied: the caller's array is not aliased."""
+        grid = np.zeros((3, 3), dtype=np.int8)
+        board = Board(size=3, grid=grid)
+        
+        grid[0, 0] = 1
+        assert board.grid[0, 0] == 0
+        board.grid[1, 1] = 2
+        assert grid[1, 1] == 0
+    
+    def test_grid_shape_must_match_size(self):
+        """A grid of the wrong shape is rejected up front."""
+        with pytest.raises(ValueError, match="does not match board size"):
+            Board(grid=np.zeros((3, 3), dtype=np.int8))
+    
     def test_is_valid_position(self):
         """Test position validation."""
         board = Board()
@@ -210,3 +232,88 @@ class TestBoardCopy:
         copy.grid[0, 0] = 0  # Modify copy
         
         assert board.grid[0, 0] == 1  # Original unchanged
+    
+    def test_copy_equality_tracks_contents(self):
+        """Copies compare equal until one of them changes."""
+        board = Board()
+        board.place_piece(get_piece(PieceType.I1), 0, 0, player_id=0)
+        
+        copy = board.copy()
+        assert copy == board
+        
+        copy.place_piece(get_piece(PieceType.I1), 19, 19, player_id=1)
+        assert copy != board
+    
+    def test_board_is_unhashable(self):
+        """Mutable boards cannot be used as dict keys or set members."""
+        with pytest.raises(TypeError):
+            hash(Board())
+    
+    def test_equality_ignores_caches(self):
+        """Equality follows the grid, whatever each board has cached."""
+        board = Board()
+        board.place_piece(get_piece(PieceType.I1), 0, 0, player_id=0)
+        copy = board.copy()
+        board.get_player_cells(0)
+        board.to_list()
+        
+        assert copy == board
+        
+        copy.place_piece(get_piece(PieceType.I1), 19, 19, player_id=1)
+        assert copy != board
+    
+    def test_zobrist_incremental_matches_recomputed(self):
+        """Incremental fingerprint equals one rebuilt from the grid."""
+        board = Board()
+        board.place_piece(get_piece(PieceType.L5), 0, 0, player_id=0)
+        board.place_piece(get_piece(PieceType.T4), 17, 17, player_id=2)
+        
+        assert board.zobrist != Board().zobrist
+        assert board.zobrist == board.copy().zobrist
+    
+    def test_to_list_cached_until_change(self):
+        """Serialized grid is reused until the board changes."""
+        board = Board()
+        first = board.to_list()
+        assert board.to_list() is first
+        
+        board.place_piece(get_piece(PieceType.I1), 0, 0, player_id=0)
+        assert board.to_list() is not first
+        assert board.to_list() == board.grid.tolist()
+    
+    def test_grid_views_flat_buffer(self):
+        """grid and grid_flat share storage, also after copying."""
+        import copy as copy_module
+        
+        board = Board()
+        board.place_piece(get_piece(PieceType.I2), 3, 4, player_id=1)
+        assert board.grid_flat[3 * BOARD_SIZE + 4] == 2
+        
+        for clone in (board.copy(), copy_module.deepcopy(board)):
+            assert bytes(clone.grid_flat) == bytes(board.grid_flat)
+            clone.grid[0, 0] = 3
+            assert clone.grid_flat[0] == 3
+            assert board.grid_flat[0] == 0
+
+
+class TestBitBoard:
+    """Test bitboards derived from the grid."""
+    
+    def test_bitboard_matches_set_queries(self):
+        """Bitboard edges/corners agree with the set-based queries."""
+        board = Board()
+        board.place_piece(get_piece(PieceType.L5), 0, 0, player_id=0)
+        board.place_piece(get_piece(PieceType.T4), 17, 17, player_id=2)
+        bits = board.bitboard
+        
+        for player_id in (0, 2):
+            assert set(mask_to_coords(bits.edges(player_id), board.size)) == board.get_player_edges(player_id)
+            assert set(mask_to_coords(bits.corners(player_id), board.size)) == board.get_player_corners(player_id)
+    
+    def test_bitboard_invalidated_on_place(self):
+        """Placing a piece refreshes the cached bitboard."""
+        board = Board()
+        before = board.bitboard
+        board.place_piece(get_piece(PieceType.I1), 0, 0, player_id=0)
+        assert board.bitboard is not before
+        assert board.bitboard.occupied == 1
@@ -232,7 +232,7 @@ class TestComplexGameStates:
         player = Player(id=0, name="Test", color="#000000")
         
         # All pieces played
-        player.remaining_pieces.clear()
+        player.remaining_pieces = frozenset()
         player.last_piece_was_monomino = False
         score = player.calculate_score()
         assert score == 15  # Bonus only
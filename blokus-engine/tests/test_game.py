@@ -3,6 +3,7 @@
 import pytest
 from blokus.game import Game, GameStatus, Move, Player
 from blokus.pieces import PieceType, get_piece
+from blokus.player_types import PlayerStatus
 
 
 class TestGameInitialization:
@@ -105,6 +106,31 @@ class TestMoveValidation:
             col=1
         )
         assert not game.is_valid_move(move2)
+    
+    def test_placement_verdict_memoized_per_position(self):
+        """Repeated checks reuse the verdict until the board changes."""
+        game = Game()
+        move = Move(player_id=0, piece_type=PieceType.I2, orientation=0, row=5, col=5)
+        
+        reason = game.get_move_rejection_reason(move)
+        assert reason is not None
+        assert game.get_move_rejection_reason(move) == reason
+        assert len(game._placement_cache) == 1
+        
+        game.board.place_piece(get_piece(PieceType.I1), 10, 10, player_id=3)
+        game.get_move_rejection_reason(move)
+        assert len(game._placement_cache) == 2
+    
+    def test_placement_verdict_not_reused_after_direct_grid_writes(self):
+        """Writing the grid directly (no zobrist update) still changes the key."""
+        game = Game()
+        move = Move(player_id=0, piece_type=PieceType.I2, orientation=0, row=5, col=5)
+        game.get_move_rejection_reason(move)
+        
+        game.board.grid[10, 10] = 4
+        game.get_move_rejection_reason(move)
+        
+        assert len(game._placement_cache) == 2
 
 
 class TestPlayMove:
@@ -181,6 +207,108 @@ class TestGetValidMoves:
         
         for move in moves[:10]:  # Check first 10
             assert game.is_valid_move(move)
+    
+    def test_valid_moves_cached_per_position(self):
+        """Repeated enumeration reuses the cache but returns fresh lists."""
+        game = Game()
+        first = game.get_valid_moves()
+        first.clear()
+        
+        assert game.get_valid_moves() == game._enumerate_valid_moves(0)
+        assert len(game._legal_moves_cache) == 1
+    
+    def test_valid_moves_cache_follows_board(self):
+        """A placed piece changes the key, so stale moves are never served."""
+        game = Game(num_players=2)
+        before = game.get_valid_moves(0)
+        game.board.place_piece(get_piece(PieceType.I1), 0, 0, player_id=1)
+        
+        assert game.get_valid_moves(0) != before
+        assert game.get_valid_moves(0) == []
+    
+    def test_valid_moves_cache_follows_direct_grid_writes(self):
+        """Writing the grid directly (no zobrist update) still changes the key."""
+        game = Game(num_players=2)
+        move = Move(player_id=0, piece_type=PieceType.I1, orientation=0, row=0, col=0)
+        assert move in game.get_valid_moves(0)
+        
+        game.board.grid[0, 0] = 2
+        
+        assert game.get_valid_moves(0) == []
+    
+    def test_valid_moves_cache_follows_same_size_piece_swap(self):
+        """Swapping a piece in place (same hand size) changes the key."""
+        game = Game()
+        game.current_player.remaining_pieces = frozenset({PieceType.I1})
+        assert {m.piece_type for m in game.get_valid_moves()} == {PieceType.I1}
+        
+        game.current_player.remaining_pieces = frozenset({PieceType.I2})
+        
+        assert {m.piece_type for m in game.get_valid_moves()} == {PieceType.I2}
+
+
+class TestSkipToPlayer:
+    """Test fast-forwarding turns."""
+    
+    def test_skip_marks_intermediate_players_passed(self):
+        """Players between current and target are passed."""
+        game = Game()
+        game.play_move(Move(0, PieceType.I1, 0, 0, 0))
+        
+        game.skip_to_player(0)
+        
+        assert game.current_player_idx == 0
+        assert game.current_player.status == PlayerStatus.PLAYING
+        assert [p.has_passed for p in game.players] == [False, True, True, True]
+        assert game.status == GameStatus.IN_PROGRESS
+    
+    def test_skip_to_current_player_is_noop(self):
+        """Skipping to the current player changes nothing."""
+        game = Game()
+        game.skip_to_player(0)
+        
+        assert game.current_player_idx == 0
+        assert not any(p.has_passed for p in game.players)
+    
+    def test_skip_to_invalid_player_raises(self):
+        """Invalid or passed target is rejected."""
+        game = Game()
+        with pytest.raises(ValueError):
+            game.skip_to_player(4)
+        
+        game.skip_to_player(2)
+        with pytest.raises(ValueError, match="already passed"):
+            game.skip_to_player(1)
+
+
+class TestResetInPlace:
+    """Test restarting a game on the same objects."""
+    
+    def test_reset_matches_fresh_game(self):
+        """A reset game looks like a new one but keeps its board buffer."""
+        game = Game()
+        grid = game.board.grid
+        game.play_move(Move(0, PieceType.I1, 0, 0, 0))
+        game.play_move(Move(1, PieceType.I2, 0, 0, 18))
+        game.pass_turn()
+        
+        game.reset_in_place()
+        fresh = Game()
+        
+        assert game.board.grid is grid
+        assert not grid.any()
+        assert game.turn_number == 0
+        assert game.current_player_idx == 0
+        assert [p.status for p in game.players] == [p.status for p in fresh.players]
+        assert all(p.remaining_pieces == set(PieceType) and not p.has_passed for p in game.players)
+        assert game.get_valid_moves() == fresh.get_valid_moves()
+    
+    def test_reset_with_starting_player(self):
+        """The starting player can be chosen."""
+        game = Game()
+        game.reset_in_place(starting_player_idx=2)
+        assert game.current_player_idx == 2
+        assert game.current_player.status == PlayerStatus.PLAYING
 
 
 class TestScoring:
@@ -213,7 +341,7 @@ class TestScoring:
         player = game.players[0]
         
         # Simulate all pieces placed
-        player.remaining_pieces.clear()
+        player.remaining_pieces = frozenset()
         
         scores = game.get_scores()
         assert scores[0] == 15  # +15 bonus, 0 remaining squares
@@ -261,7 +389,7 @@ class TestGameOver:
     def test_get_winner_clear_winner(self):
         """Should return the player with the highest score."""
         game = Game(num_players=2)
-        game.players[0].remaining_pieces.clear() # Player 0 score = 15
+        game.players[0].remaining_pieces = frozenset() # Player 0 score = 15
         
         assert game.get_winner() == 0
 
@@ -272,7 +400,7 @@ class TestGameOver:
         player = game.players[0]
         
         # Simulate all pieces placed, monomino last
-        player.remaining_pieces.clear()
+        player.remaining_pieces = frozenset()
         # In current implementation, it checks last_piece_was_monomino.
         player.last_piece_was_monomino = True
         
@@ -158,6 +158,22 @@ class TestGameManagerQueries:
         player = manager.get_player_by_id(99)
         assert player is None
     
+    def test_get_player_by_id_after_players_change(self):
+        """Lookups follow players being appended or reassigned."""
+        manager = GameManager([Player(id=0, name="Alice", color="#3b82f6")])
+        assert manager.get_player_by_id(0).name == "Alice"
+        
+        manager.players.append(Player(id=5, name="Bob", color="#22c55e"))
+        assert manager.get_player_by_id(5).name == "Bob"
+        
+        manager.players = [
+            Player(id=5, name="Bob", color="#22c55e"),
+            Player(id=0, name="Alice", color="#3b82f6")
+        ]
+        assert manager.get_player_by_id(0).name == "Alice"
+        manager.set_starting_player(0)
+        assert manager.current_player_index == 1
+    
     def test_get_player_index(self):
         """Test getting player index."""
         players = [
@@ -481,6 +497,16 @@ class TestGameManagerState:
         
         assert winner is None
     
+    def test_get_winner_tie_then_higher_negative(self):
+        """An early tie does not hide a later, strictly higher score."""
+        players = [Player(id=i, name=f"P{i}", color="#000000") for i in range(4)]
+        for player, score in zip(players, (-20, -20, -5, -30)):
+            player.score = score
+            player.has_passed = True
+        manager = GameManager(players)
+        
+        assert manager.get_winner() is players[2]
+    
     def test_get_winner_game_not_over(self):
         """Test getting winner when game not over returns None."""
         players = [
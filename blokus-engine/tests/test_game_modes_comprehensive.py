@@ -404,7 +404,7 @@ class TestScoring:
         from blokus.player import Player
         
         player = Player(id=0, name="Test", color="#000000")
-        player.remaining_pieces.clear()
+        player.remaining_pieces = frozenset()
         player.last_piece_was_monomino = True
         
         assert player.calculate_score() == 20
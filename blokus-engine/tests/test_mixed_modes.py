@@ -1,27 +1,53 @@
 
+import copy
+
 import pytest
 from blokus.game_manager_factory import GameManagerFactory
-from blokus.game import Game
+from blokus.game import Game, GameStatus
 from blokus.player_types import PlayerType
 from blokus.board import Board
 
+# Standard 2P turn sequence: (player index, controlling type)
+EXPECTED_2P_ORDER = [
+    (0, PlayerType.HUMAN),  # Blue
+    (1, PlayerType.AI),     # Green
+    (2, PlayerType.HUMAN),  # Yellow
+    (3, PlayerType.AI),     # Red
+]
+
+
+@pytest.fixture(scope="module")
+def _std_2p_template():
+    """Standard 2P GameManager (HumanMaster vs AIMaster), built once per module."""
+    player_configs = [
+        {"id": 0, "name": "HumanMaster", "type": "human"}, # P1
+        {"id": 1, "name": "AIMaster", "type": "ai", "persona": "random"}    # P2
+    ]
+    # Note: create_standard_2p_game calls create_from_config internally, which calls PlayerFactory
+    return GameManagerFactory.create_standard_2p_game(player_configs)
+
+
+@pytest.fixture
+def std_2p_gm(_std_2p_template):
+    """Independent clone of the standard 2P GameManager."""
+    return copy.deepcopy(_std_2p_template)
+
+
+@pytest.fixture
+def std_2p_game(std_2p_gm):
+    """Standard 2P game (20x20) on a fresh board."""
+    return Game(game_manager=std_2p_gm) # Default board is 20
+
+
 class TestMixedModes:
     """
     Integration tests for mixed Human/AI games across different modes.
     Ensures turn rotation and player configuration works as expected.
     """
 
-    def test_std_4p_mixed(self):
+    def test_std_4p_mixed(self, fresh_game):
         """Test Standard 4P: 1 Human, 3 AI."""
-        player_configs = [
-            {"id": 0, "name": "Human", "type": "human"},
-            {"id": 1, "name": "AI 1", "type": "ai", "persona": "random"},
-            {"id": 2, "name": "AI 2", "type": "ai", "persona": "random"},
-            {"id": 3, "name": "AI 3", "type": "ai", "persona": "random"}
-        ]
-        
-        gm = GameManagerFactory.create_from_config(player_configs)
-        game = Game(game_manager=gm)
+        game = fresh_game
         
         assert len(game.players) == 4
         assert game.players[0].type == PlayerType.HUMAN
@@ -68,21 +94,13 @@ class TestMixedModes:
         from blokus.game import GameStatus
         assert game.status == GameStatus.FINISHED
 
-    def test_std_2p_mixed_split_control(self):
+    def test_std_2p_mixed_split_control(self, std_2p_game):
         """
         Test Standard 2P Mode (20x20): 1 Human vs 1 AI.
         Each should control 2 colors.
         Order: Human(Blue) -> AI(Green) -> Human(Yellow) -> AI(Red).
         """
-        player_configs = [
-            {"id": 0, "name": "HumanMaster", "type": "human"}, # P1
-            {"id": 1, "name": "AIMaster", "type": "ai", "persona": "random"}    # P2
-        ]
-        
-        # Use formatting factory for Standard 2P
-        gm = GameManagerFactory.create_standard_2p_game(player_configs)
-        # Note: create_standard_2p_game calls create_from_config internally, which calls PlayerFactory
-        game = Game(game_manager=gm) # Default board is 20
+        game = std_2p_game
         
         assert game.board.size == 20
         assert len(game.players) == 4 # 4 Logical players
@@ -111,44 +129,28 @@ class TestMixedModes:
         assert "Bot" in p3.name
         assert p3.type == PlayerType.AI
         
-        # Verify Turn Sequence
-        # Turn 1: Blue (Human)
-        assert game.current_player_idx == 0
-        assert game.current_player.type == PlayerType.HUMAN
-        game.pass_turn()
-        
-        # Turn 2: Green (AI)
-        assert game.current_player_idx == 1
-        assert game.current_player.type == PlayerType.AI
-        game.pass_turn()
-        
-        # Turn 3: Yellow (Human)
-        assert game.current_player_idx == 2
-        assert game.current_player.type == PlayerType.HUMAN
-        game.pass_turn()
-        
-        # Turn 4: Red (AI)
-        assert game.current_player_idx == 3
-        assert game.current_player.type == PlayerType.AI
-        game.pass_turn()
+        # Verify Turn Sequence: Blue, Green, Yellow, Red
+        for idx, player_type in EXPECTED_2P_ORDER:
+            assert game.current_player_idx == idx
+            assert game.current_player.type == player_type
+            game.pass_turn()
+
+    def test_std_2p_game_finished_after_all_pass(self, std_2p_game):
+        """Standard 2P game ends once all 4 colors have passed."""
+        for _ in EXPECTED_2P_ORDER:
+            assert std_2p_game.status == GameStatus.IN_PROGRESS
+            std_2p_game.pass_turn()
         
-        # Turn 5: Game Over (All passed)
-        from blokus.game import GameStatus
-        assert game.status == GameStatus.FINISHED
+        assert std_2p_game.status == GameStatus.FINISHED
 
-    def test_std_2p_human_vs_ai_types(self):
+    def test_std_2p_human_vs_ai_types(self, std_2p_gm):
         """
         Verify that in Standard 2P (1 Human vs 1 AI), the backend correctly
         assigns the AI type to both colors controlled by the AI.
         P1 (Human): Blue(0), Yellow(2)
         P2 (AI): Green(1), Red(3)
         """
-        player_configs = [
-            {"id": 0, "name": "Human", "type": "human"},
-            {"id": 1, "name": "Bot", "type": "ai", "persona": "random"}
-        ]
-        
-        gm = GameManagerFactory.create_standard_2p_game(player_configs)
+        gm = std_2p_gm
         
         # Check P0 (Blue) -> Human
         p0 = gm.players[0]
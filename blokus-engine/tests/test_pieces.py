@@ -1,21 +1,30 @@
 """Tests for the pieces module."""
 
+import numpy as np
 import pytest
+from blokus.bitboard import coords_mask
 from blokus.pieces import (
     Piece, PieceType, PIECES, PIECE_SHAPES,
-    get_piece, get_all_pieces, num_orientations,
+    get_piece, get_all_pieces, num_orientations, get_piece_masks, get_oriented_piece,
     _normalize_coords, _rotate_90, _flip_horizontal
 )
 
 
+# Distinct orientation shapes per piece (PIECES is immutable module data)
+_ORIENTATION_SIG = {pt: frozenset(p.coords for p in PIECES[pt]) for pt in PieceType}
+
+
 class TestPieceShapes:
     """Test piece definitions."""
     
-    def test_all_21_pieces_defined(self):
+    @pytest.mark.parametrize("pieces, expected", [
+        pytest.param(PieceType, 21, id="enum"),
+        pytest.param(PIECE_SHAPES, 21, id="shapes"),
+        pytest.param(PIECES, 21, id="orientations"),
+    ])
+    def test_all_21_pieces_defined(self, pieces, expected):
         """Verify all 21 pieces are defined."""
-        assert len(PieceType) == 21
-        assert len(PIECE_SHAPES) == 21
-        assert len(PIECES) == 21
+        assert len(pieces) == expected
     
     def test_piece_sizes(self):
         """Verify each piece has correct number of squares."""
@@ -54,6 +63,12 @@ class TestPieceOrientations:
         """O4 (square) has only 1 orientation."""
         assert num_orientations(PieceType.O4) == 1
     
+    def test_oriented_piece_does_not_wrap(self):
+        """get_oriented_piece rejects orientations get_piece would wrap."""
+        assert get_oriented_piece(PieceType.I2, 1) is get_piece(PieceType.I2, 1)
+        assert get_oriented_piece(PieceType.I2, 2) is None
+        assert get_oriented_piece(PieceType.I2, -1) is None
+    
     def test_x_has_one_orientation(self):
         """X pentomino (plus sign) has only 1 orientation."""
         assert num_orientations(PieceType.X) == 1
@@ -65,46 +80,96 @@ class TestPieceOrientations:
         # Z has rotational symmetry, so only 4 unique orientations
         assert num_orientations(PieceType.Z) == 4, "Z should have 4 orientations"
     
-    def test_all_orientations_unique(self):
+    @pytest.mark.parametrize("piece_type", list(PieceType), ids=lambda pt: pt.value)
+    def test_all_orientations_unique(self, piece_type):
         """All orientations of a piece should be unique."""
-        for piece_type in PieceType:
-            orientations = PIECES[piece_type]
-            coords_set = {piece.coords for piece in orientations}
-            assert len(coords_set) == len(orientations), f"{piece_type.value} has duplicate orientations"
+        assert len(_ORIENTATION_SIG[piece_type]) == len(PIECES[piece_type]), \
+            f"{piece_type.value} has duplicate orientations"
+
+
+# Every orientation of every piece, padded into one (N, 5, 2) batch
+_PAD = -128
+_ALL_SHAPES = [piece.coords for orientations in PIECES.values() for piece in orientations]
+
+
+def _to_batch(shapes, offset=(0, 0)):
+    """Stack shapes into a padded int16 array, shifted by offset."""
+    batch = np.full((len(shapes), 5, 2), _PAD, dtype=np.int16)
+    for i, coords in enumerate(shapes):
+        batch[i, :len(coords)] = np.array(sorted(coords)) + offset
+    return batch
+
+
+def _from_batch(batch):
+    """Convert a padded batch back to frozensets of coordinates."""
+    return [frozenset((int(r), int(c)) for r, c in cells if r != _PAD) for cells in batch]
+
+
+def _np_normalize(batch):
+    """Vectorized oracle for _normalize_coords."""
+    valid = batch[..., :1] != _PAD
+    mins = np.where(valid, batch, np.iinfo(np.int16).max).min(axis=1, keepdims=True)
+    return np.where(valid, batch - mins, _PAD)
+
+
+def _np_rotate_90(batch):
+    """Vectorized oracle for _rotate_90 (clockwise)."""
+    valid = batch[..., :1] != _PAD
+    rotated = np.stack([batch[..., 1], -batch[..., 0]], axis=-1)
+    return _np_normalize(np.where(valid, rotated, _PAD))
+
+
+def _np_flip_horizontal(batch):
+    """Vectorized oracle for _flip_horizontal."""
+    valid = batch[..., :1] != _PAD
+    max_col = np.where(valid[..., 0], batch[..., 1], _PAD).max(axis=1, keepdims=True)
+    flipped = np.stack([batch[..., 0], max_col - batch[..., 1]], axis=-1)
+    return _np_normalize(np.where(valid, flipped, _PAD))
 
 
 class TestPieceTransformations:
-    """Test rotation and flip operations."""
-    
-    def test_normalize_coords(self):
-        """Normalization should shift to origin."""
-        coords = [(2, 3), (2, 4), (3, 3)]
-        normalized = _normalize_coords(coords)
-        assert normalized == frozenset([(0, 0), (0, 1), (1, 0)])
-    
-    def test_rotate_90_single(self):
-        """Test 90 degree rotation."""
-        # Horizontal line -> vertical line
-        coords = frozenset([(0, 0), (0, 1), (0, 2)])
-        rotated = _rotate_90(coords)
-        expected = frozenset([(0, 0), (1, 0), (2, 0)])
-        assert rotated == expected
-    
-    def test_four_rotations_returns_to_original(self):
-        """Four 90° rotations should return to original."""
-        original = frozenset([(0, 0), (0, 1), (1, 0)])
-        current = original
-        for _ in range(4):
-            current = _rotate_90(current)
-        assert current == original
-    
-    def test_flip_horizontal(self):
-        """Test horizontal flip."""
-        # L shape
+    """Test rotation and flip operations against a batched NumPy oracle."""
+    
+    @pytest.mark.parametrize("transform, oracle", [
+        pytest.param(_normalize_coords, _np_normalize, id="normalize"),
+        pytest.param(_rotate_90, _np_rotate_90, id="rotate_90"),
+        pytest.param(_flip_horizontal, _np_flip_horizontal, id="flip_horizontal"),
+    ])
+    def test_transform_matches_oracle(self, transform, oracle):
+        """Each transform agrees with the oracle on every (shifted) piece orientation."""
+        shifted = _from_batch(_to_batch(_ALL_SHAPES, offset=(2, 3)))
+        expected = _from_batch(oracle(_to_batch(_ALL_SHAPES, offset=(2, 3))))
+        assert [transform(coords) for coords in shifted] == expected
+    
+    def test_transform_invariants(self):
+        """Cell count is preserved, four rotations and two flips are identities."""
+        for coords in _ALL_SHAPES:
+            shape = frozenset(coords)
+            
+            rotated = shape
+            for _ in range(4):
+                rotated = _rotate_90(rotated)
+            
+            assert rotated == shape
+            assert _flip_horizontal(_flip_horizontal(shape)) == shape
+            assert len(_rotate_90(shape)) == len(shape)
+            assert len(_flip_horizontal(shape)) == len(shape)
+    
+    def test_rotate_90_l4(self):
+        """L4 rotated clockwise: the foot ends up under the start of the bar."""
+        l4 = frozenset(PIECE_SHAPES[PieceType.L4])
+        assert l4 == frozenset([(0, 0), (1, 0), (2, 0), (2, 1)])
+        assert _rotate_90(l4) == frozenset([(0, 0), (0, 1), (0, 2), (1, 0)])
+    
+    def test_flip_horizontal_i2(self):
+        """A horizontal domino is its own mirror image."""
+        i2 = frozenset(PIECE_SHAPES[PieceType.I2])
+        assert _flip_horizontal(i2) == frozenset([(0, 0), (0, 1)])
+    
+    def test_flip_horizontal_l3(self):
+        """Mirroring the small L moves its stem to the other side."""
         coords = frozenset([(0, 0), (0, 1), (1, 0)])
-        flipped = _flip_horizontal(coords)
-        expected = frozenset([(0, 0), (0, 1), (1, 1)])
-        assert flipped == expected
+        assert _flip_horizontal(coords) == frozenset([(0, 0), (0, 1), (1, 1)])
 
 
 class TestPieceCorners:
@@ -125,16 +190,15 @@ class TestPieceCorners:
         # Should have corners only at the ends, not in the middle
         assert len(corners) == 4
     
-    def test_corners_not_edge_adjacent(self):
+    @pytest.mark.parametrize("piece_type", list(PieceType), ids=lambda pt: pt.value)
+    def test_corners_not_edge_adjacent(self, piece_type):
         """Corners should not be edge-adjacent to any piece square."""
-        for piece_type in PieceType:
-            piece = get_piece(piece_type)
-            corners = piece.get_corners()
-            for corner in corners:
-                for r, c in piece.coords:
-                    # Manhattan distance should be > 1 (not edge adjacent)
-                    dist = abs(corner[0] - r) + abs(corner[1] - c)
-                    assert dist > 1, f"Corner {corner} is edge-adjacent to ({r},{c}) in {piece_type.value}"
+        piece = get_piece(piece_type)
+        corners = np.array(sorted(piece.get_corners()), dtype=np.int8)
+        coords = np.array(piece.coords_list, dtype=np.int8)
+        # Pairwise Manhattan distances (corners x cells) should all be > 1
+        dists = np.abs(corners[:, None, :] - coords[None, :, :]).sum(axis=-1)
+        assert dists.min() > 1, f"A corner is edge-adjacent to {piece_type.value}"
 
 
 class TestPieceEdges:
@@ -152,12 +216,18 @@ class TestPieceEdges:
 class TestPieceMatrix:
     """Test matrix conversion."""
     
+    @pytest.mark.parametrize("piece", [p for ps in PIECES.values() for p in ps], ids=repr)
+    def test_bbox_matches_matrix(self, piece):
+        """Precomputed bounding box equals the matrix shape."""
+        assert (piece.bbox_h, piece.bbox_w) == piece.to_matrix().shape == piece.bounding_box()
+    
     def test_monomino_matrix(self):
         """Monomino should be 1x1 matrix."""
         piece = get_piece(PieceType.I1)
         matrix = piece.to_matrix()
         assert matrix.shape == (1, 1)
         assert matrix[0, 0] == 1
+        assert piece.to_matrix() is matrix  # Cached buffer is reused
     
     def test_domino_matrix(self):
         """Domino should be 1x2 or 2x1 matrix depending on orientation."""
@@ -165,3 +235,31 @@ class TestPieceMatrix:
         matrix = piece.to_matrix()
         assert matrix.sum() == 2
         assert 1 in matrix.shape and 2 in matrix.shape
+        assert not matrix.flags.writeable
+
+
+class TestPieceMasks:
+    """Test precomputed placement bitboards."""
+    
+    @pytest.mark.parametrize("piece_type", list(PieceType), ids=lambda pt: pt.name)
+    def test_masks_match_translated_coords(self, piece_type):
+        """Table entries equal masks built from translated coordinates."""
+        size = 14
+        masks = get_piece_masks(size)[piece_type]
+        
+        for piece in PIECES[piece_type]:
+            height, width = piece.bounding_box()
+            for row, col in [(0, 0), (size - height, size - width), (size - 1, size - 1)]:
+                placement = masks.placements[piece.orientation_id][row * size + col]
+                if row + height > size or col + width > size:
+                    assert placement == 0
+                    continue
+                in_bounds = lambda cells: [
+                    (r + row, c + col) for r, c in cells
+                    if 0 <= r + row < size and 0 <= c + col < size
+                ]
+                assert placement == coords_mask(in_bounds(piece.coords), size)
+                assert masks.edges[piece.orientation_id][row * size + col] == \
+                    coords_mask(in_bounds(piece.get_edges()), size)
+                assert masks.diagonals[piece.orientation_id][row * size + col] == \
+                    coords_mask(in_bounds(piece.get_corners()), size)
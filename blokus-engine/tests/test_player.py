@@ -1,9 +1,25 @@
 """Tests for the unified Player class."""
 
+import pickle
+
 import pytest
 from blokus.player import Player
 from blokus.player_types import PlayerType, PlayerStatus
-from blokus.pieces import PieceType
+from blokus.pieces import PieceType, PIECE_BIT_BY_TYPE
+
+
+# Expected attributes of Player(id=0, name="Alice", color="#3b82f6")
+GOLDEN_DEFAULT_STATE = {
+    "id": 0,
+    "name": "Alice",
+    "color": "#3b82f6",
+    "type": PlayerType.HUMAN,
+    "persona": None,
+    "status": PlayerStatus.WAITING,
+    "score": 0,
+    "has_passed": False,
+    "last_piece_was_monomino": False,
+}
 
 
 class TestPlayerInitialization:
@@ -13,16 +29,9 @@ class TestPlayerInitialization:
         """Default player initialization."""
         player = Player(id=0, name="Alice", color="#3b82f6")
         
-        assert player.id == 0
-        assert player.name == "Alice"
-        assert player.color == "#3b82f6"
-        assert player.type == PlayerType.HUMAN
-        assert player.persona is None
-        assert player.status == PlayerStatus.WAITING
-        assert player.score == 0
+        state = {key: getattr(player, key) for key in GOLDEN_DEFAULT_STATE}
+        assert state == GOLDEN_DEFAULT_STATE
         assert len(player.remaining_pieces) == 21
-        assert not player.has_passed
-        assert not player.last_piece_was_monomino
     
     def test_ai_player_initialization(self):
         """AI player initialization."""
@@ -63,6 +72,16 @@ class TestPlayerInitialization:
         assert player.score == 50
 
 
+@pytest.fixture(scope="session")
+def type_players():
+    """Read-only human / AI / AI-without-persona players."""
+    return {
+        "human": Player(id=0, name="Alice", color="#3b82f6"),
+        "ai": Player(id=1, name="Bot", color="#22c55e", type=PlayerType.AI, persona="random"),
+        "ai_no_persona": Player(id=2, name="Bot", color="#eab308", type=PlayerType.AI),
+    }
+
+
 class TestPlayerProperties:
     """Test player properties."""
     
@@ -84,32 +103,56 @@ class TestPlayerProperties:
         player.play_piece(PieceType.F)
         assert player.squares_remaining == 84  # 89 - 5
     
-    def test_is_ai_property(self):
-        """Test is_ai property."""
-        human = Player(id=0, name="Alice", color="#3b82f6")
-        ai = Player(id=1, name="Bot", color="#22c55e", type=PlayerType.AI)
+    def test_squares_remaining_tracks_direct_changes(self):
+        """Running count follows play_piece and edits made elsewhere."""
+        player = Player(id=0, name="Alice", color="#3b82f6")
+        assert player.squares_remaining == 89
+        
+        player.remaining_pieces = player.remaining_pieces - {PieceType.I5}
+        assert player.squares_remaining == 84
+        player.play_piece(PieceType.I1)
+        assert player.squares_remaining == 83
         
-        assert not human.is_ai
-        assert ai.is_ai
+        player.remaining_pieces = {PieceType.I2}
+        assert player.squares_remaining == 2
     
-    def test_is_human_property(self):
-        """Test is_human property."""
-        human = Player(id=0, name="Alice", color="#3b82f6")
-        ai = Player(id=1, name="Bot", color="#22c55e", type=PlayerType.AI)
+    def test_counts_track_same_size_swaps(self):
+        """Swapping one piece for another in place (same size) is seen."""
+        player = Player(id=0, name="Alice", color="#3b82f6")
+        player.remaining_pieces = {PieceType.I1, PieceType.I2}
+        assert player.squares_remaining == 3
+        mask = player.remaining_mask
         
-        assert human.is_human
-        assert not ai.is_human
+        player.remaining_pieces = player.remaining_pieces - {PieceType.I2}
+        player.remaining_pieces = player.remaining_pieces | {PieceType.I5}
+        
+        assert player.squares_remaining == 6
+        assert player.remaining_mask != mask
+        assert player.remaining_mask == PIECE_BIT_BY_TYPE[PieceType.I1] | PIECE_BIT_BY_TYPE[PieceType.I5]
     
+    def test_remaining_mask(self):
+        """Mask has one bit per remaining piece and follows removals."""
+        player = Player(id=0, name="Alice", color="#3b82f6")
+        assert player.remaining_mask == (1 << len(PieceType)) - 1
+        
+        player.play_piece(PieceType.F)
+        player.remaining_pieces = player.remaining_pieces - {PieceType.X}
+        expected = sum(PIECE_BIT_BY_TYPE[pt] for pt in player.remaining_pieces)
+        assert player.remaining_mask == expected
+        assert not player.remaining_mask & PIECE_BIT_BY_TYPE[PieceType.F]
     
-    def test_display_name_property(self):
-        """Test display_name property."""
-        human = Player(id=0, name="Alice", color="#3b82f6")
-        ai = Player(id=1, name="Bot", color="#22c55e", type=PlayerType.AI, persona="random")
-        ai_no_persona = Player(id=2, name="Bot", color="#eab308", type=PlayerType.AI)
-        
-        assert human.display_name == "Alice"
-        assert ai.display_name == "Bot (random)"
-        assert ai_no_persona.display_name == "Bot"
+    @pytest.mark.parametrize("key, is_ai, is_human, display_name", [
+        pytest.param("human", False, True, "Alice", id="human"),
+        pytest.param("ai", True, False, "Bot (random)", id="ai"),
+        pytest.param("ai_no_persona", True, False, "Bot", id="ai_no_persona"),
+    ])
+    def test_type_properties(self, type_players, key, is_ai, is_human, display_name):
+        """Test is_ai, is_human and display_name properties."""
+        player = type_players[key]
+        
+        assert player.is_ai is is_ai
+        assert player.is_human is is_human
+        assert player.display_name == display_name
 
 
 class TestPlayerActions:
@@ -148,73 +191,95 @@ class TestPlayerActions:
         assert PieceType.F not in player.remaining_pieces
         assert not player.last_piece_was_monomino
     
-    def test_pass_turn(self):
-        """Test passing turn."""
+    def test_remaining_piece_names_follow_plays(self):
+        """Sorted names stay in step with play_piece and reassigned hands."""
         player = Player(id=0, name="Alice", color="#3b82f6")
+        before = player.remaining_piece_names
         
-        player.pass_turn()
+        player.play_piece(PieceType.F)
         
-        assert player.has_passed
-        assert player.status == PlayerStatus.PASSED
-
-
-class TestPlayerScoring:
-    """Test player scoring."""
-    
-    def test_initial_score(self):
-        """Test initial score."""
-        player = Player(id=0, name="Alice", color="#3b82f6")
+        assert player.remaining_piece_names == sorted(pt.name for pt in player.remaining_pieces)
+        assert "F" in before  # Previously returned list is left untouched
         
-        score = player.calculate_score()
+        player.remaining_pieces = player.remaining_pieces - {PieceType.X}
+        player.remaining_pieces = player.remaining_pieces | {PieceType.F}  # Same size, different pieces
+        assert "F" in player.remaining_piece_names
+        assert "X" not in player.remaining_piece_names
         
-        assert score == -89  # All squares remaining
-        assert player.score == -89
+        player.remaining_pieces = frozenset()
+        assert player.remaining_piece_names == []
     
-    def test_score_after_playing_piece(self):
-        """Test score after playing pieces."""
+    def test_play_piece_keeps_counters_current(self):
+        """Counters updated by play_piece match a recount of the new hand."""
         player = Player(id=0, name="Alice", color="#3b82f6")
         
-        # Play a 5-square piece
-        player.play_piece(PieceType.F)
-        score = player.calculate_score()
-        
-        assert score == -84  # 89 - 5 = 84 remaining
-        assert player.score == -84
+        for piece_type in (PieceType.X, PieceType.I1, PieceType.L4):
+            player.play_piece(piece_type)
+            fresh = Player(id=1, name="Bob", color="#22c55e", remaining_pieces=set(player.remaining_pieces))
+            assert player.squares_remaining == fresh.squares_remaining
+            assert player.remaining_mask == fresh.remaining_mask
+            assert player.remaining_piece_names == fresh.remaining_piece_names
     
-    def test_all_pieces_bonus(self):
-        """Test bonus for all pieces placed."""
+    def test_remaining_pieces_cannot_change_in_place(self):
+        """The hand is a frozenset: changes go through a new assignment."""
         player = Player(id=0, name="Alice", color="#3b82f6")
+        assert isinstance(player.remaining_pieces, frozenset)
+        with pytest.raises(AttributeError):
+            player.remaining_pieces.discard(PieceType.X)
         
-        # Simulate all pieces placed
-        player.remaining_pieces.clear()
-        score = player.calculate_score()
-        
-        assert score == 15  # +15 bonus, 0 remaining squares
-        assert player.score == 15
+        player.remaining_pieces = {PieceType.X}
+        assert player.squares_remaining == 5
+        assert isinstance(player.remaining_pieces, frozenset)
     
-    def test_monomino_last_bonus(self):
-        """Test bonus for monomino as last piece."""
+    def test_pass_turn(self):
+        """Test passing turn."""
         player = Player(id=0, name="Alice", color="#3b82f6")
         
-        # Simulate all pieces placed with monomino last
-        player.remaining_pieces.clear()
-        player.last_piece_was_monomino = True
-        score = player.calculate_score()
+        player.pass_turn()
         
-        assert score == 20  # 15 (all) + 5 (monomino bonus)
-        assert player.score == 20
+        assert player.has_passed
+        assert player.status == PlayerStatus.PASSED
+
+
+@pytest.fixture(scope="session")
+def _empty_player_bytes():
+    """Pickled player with every piece placed, built once per session."""
+    player = Player(id=0, name="Alice", color="#3b82f6")
+    player.remaining_pieces = frozenset()
+    return pickle.dumps(player)
+
+
+@pytest.fixture
+def empty_player(_empty_player_bytes):
+    """Fresh player with no remaining pieces."""
+    return pickle.loads(_empty_player_bytes)
+
+
+class TestPlayerScoring:
+    """Test player scoring."""
     
-    def test_no_monomino_last_bonus(self):
-        """Test no bonus when monomino not last."""
+    @pytest.mark.parametrize("setup, expected", [
+        pytest.param(lambda p: None, -89, id="initial"),  # All squares remaining
+        pytest.param(lambda p: p.play_piece(PieceType.F), -84, id="after_playing_piece"),  # 89 - 5
+    ])
+    def test_calculate_score(self, setup, expected):
+        """Score reflects remaining squares."""
         player = Player(id=0, name="Alice", color="#3b82f6")
+        setup(player)
         
-        # Simulate all pieces placed without monomino last
-        player.remaining_pieces.clear()
-        player.last_piece_was_monomino = False
-        score = player.calculate_score()
-        
-        assert score == 15  # Only +15 bonus
-        assert player.score == 15
+        assert player.calculate_score() == expected
+        assert player.score == expected
+    
+    @pytest.mark.parametrize("monomino_last, expected", [
+        pytest.param(False, 15, id="all_pieces_bonus"),  # Only +15 bonus
+        pytest.param(True, 20, id="monomino_last_bonus"),  # 15 (all) + 5 (monomino bonus)
+    ])
+    def test_all_pieces_placed_score(self, empty_player, monomino_last, expected):
+        """Score bonuses once all pieces are placed."""
+        empty_player.last_piece_was_monomino = monomino_last
+        
+        assert empty_player.calculate_score() == expected
+        assert empty_player.score == expected
 
 
 class TestPlayerSerialization:
@@ -344,14 +409,11 @@ class TestPlayerSerialization:
 class TestPlayerEdgeCases:
     """Test edge cases and error conditions."""
     
-    def test_empty_remaining_pieces(self):
+    def test_empty_remaining_pieces(self, empty_player):
         """Test player with no remaining pieces."""
-        player = Player(id=0, name="Alice", color="#3b82f6")
-        player.remaining_pieces.clear()
-        
-        assert player.pieces_count == 0
-        assert player.squares_remaining == 0
-        assert player.calculate_score() == 15  # All pieces bonus
+        assert empty_player.pieces_count == 0
+        assert empty_player.squares_remaining == 0
+        assert empty_player.calculate_score() == 15  # All pieces bonus
     
     def test_multiple_pass_turns(self):
         """Test multiple pass_turn calls."""
@@ -1,10 +1,30 @@
 """Tests for PlayerFactory."""
 
+import re
+
 import pytest
 from blokus.player_factory import PlayerFactory
 from blokus.player_types import PlayerType
 
 
+# Shared player configs (read-only: the factory never mutates them)
+_CONFIG_MIXED = (
+    {"id": 0, "name": "Alice", "type": "human"},
+    {"id": 1, "type": "ai", "persona": "random"},
+    {"id": 2, "name": "Charlie", "type": "human"},
+    {"id": 3, "type": "ai", "persona": "aggressive"},
+)
+
+_CONFIG_WITH_DEFAULTS = (
+    {"type": "human"},  # No id, name, or color
+    {"id": 1, "type": "ai", "persona": "defensive"},
+    {"name": "Custom Name", "type": "human", "color": "#ff0000"},
+)
+
+
+_BAD_COUNT_RE = re.compile("num_players must be 2 or 4")
+
+
 class TestPlayerFactory:
     """Test PlayerFactory."""
     
@@ -81,16 +101,15 @@ class TestPlayerFactory:
         assert player4.color == "#3b82f6"  # Back to Blue
         assert player5.color == "#22c55e"  # Green
     
+    def test_default_color_mask_is_power_of_two_sized(self):
+        """Color wrap-around via bit mask requires a power-of-two palette."""
+        n = len(PlayerFactory.DEFAULT_COLORS)
+        assert n & (n - 1) == 0
+        assert PlayerFactory._COLOR_MASK == n - 1
+    
     def test_create_players_from_config(self):
         """Test creating players from configuration."""
-        config = [
-            {"id": 0, "name": "Alice", "type": "human"},
-            {"id": 1, "type": "ai", "persona": "random"},
-            {"id": 2, "name": "Charlie", "type": "human"},
-            {"id": 3, "type": "ai", "persona": "aggressive"}
-        ]
-        
-        players = PlayerFactory.create_players_from_config(config)
+        players = PlayerFactory.create_players_from_config(_CONFIG_MIXED)
         
         assert len(players) == 4
         
@@ -108,13 +127,7 @@ class TestPlayerFactory:
     
     def test_create_players_from_config_with_defaults(self):
         """Test creating players from config with default values."""
-        config = [
-            {"type": "human"},  # No id, name, or color
-            {"id": 1, "type": "ai", "persona": "defensive"},
-            {"name": "Custom Name", "type": "human", "color": "#ff0000"}
-        ]
-        
-        players = PlayerFactory.create_players_from_config(config)
+        players = PlayerFactory.create_players_from_config(_CONFIG_WITH_DEFAULTS)
         
         assert len(players) == 3
         
@@ -160,16 +173,11 @@ class TestPlayerFactory:
             assert player.is_human
             assert not player.is_ai
     
-    def test_create_standard_players_invalid_count(self):
+    @pytest.mark.parametrize("num_players", [1, 3, 5])
+    def test_create_standard_players_invalid_count(self, num_players):
         """Test creating standard players with invalid count."""
-        with pytest.raises(ValueError, match="num_players must be 2 or 4"):
-            PlayerFactory.create_standard_players(1)
-        
-        with pytest.raises(ValueError, match="num_players must be 2 or 4"):
-            PlayerFactory.create_standard_players(3)
-        
-        with pytest.raises(ValueError, match="num_players must be 2 or 4"):
-            PlayerFactory.create_standard_players(5)
+        with pytest.raises(ValueError, match=_BAD_COUNT_RE):
+            PlayerFactory.create_standard_players(num_players)
     
     
     def test_factory_creates_consistent_players(self):
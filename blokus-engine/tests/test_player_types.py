@@ -6,18 +6,74 @@ from blokus.player_types import (
     MoveState, UIState
 )
 
-
-class TestPlayerType:
-    """Test PlayerType enum."""
-    
-    def test_player_type_values(self):
-        """Test enum values."""
-        assert PlayerType.HUMAN.value == "human"
-        assert PlayerType.AI.value == "ai"
-    
-    def test_player_type_count(self):
-        """Test number of player types."""
-        assert len(PlayerType) == 2
+# Cheap tests: keep them on a single xdist worker
+pytestmark = pytest.mark.xdist_group("trivial")
+
+
+# Expected (enum class, member count) for every enum in player_types
+ENUM_COUNTS = [
+    (PlayerType, 2),
+    (PlayerStatus, 4),
+    (GameState, 6),
+    (TurnState, 7),
+    (MoveState, 8),
+    (UIState, 7),
+]
+
+# Expected (enum class, member name, value) triples
+ENUM_VALUES = [
+    (PlayerType, "HUMAN", "human"),
+    (PlayerType, "AI", "ai"),
+    (PlayerStatus, "WAITING", "waiting"),
+    (PlayerStatus, "PLAYING", "playing"),
+    (PlayerStatus, "PASSED", "passed"),
+    (PlayerStatus, "FINISHED", "finished"),
+    (GameState, "INITIALIZING", "initializing"),
+    (GameState, "WAITING_START", "waiting_start"),
+    (GameState, "PLAYING", "playing"),
+    (GameState, "PAUSED", "paused"),
+    (GameState, "FINISHED", "finished"),
+    (GameState, "ABORTED", "aborted"),
+    (TurnState, "STARTING", "starting"),
+    (TurnState, "SELECTING_PIECE", "selecting_piece"),
+    (TurnState, "PLACING_PIECE", "placing_piece"),
+    (TurnState, "VALIDATING_MOVE", "validating_move"),
+    (TurnState, "EXECUTING_MOVE", "executing_move"),
+    (TurnState, "ENDING", "ending"),
+    (TurnState, "PASSED", "passed"),
+    (MoveState, "PROPOSED", "proposed"),
+    (MoveState, "VALIDATING", "validating"),
+    (MoveState, "VALID", "valid"),
+    (MoveState, "INVALID", "invalid"),
+    (MoveState, "EXECUTED", "executed"),
+    (MoveState, "ANIMATING", "animating"),
+    (MoveState, "COMPLETED", "completed"),
+    (MoveState, "FAILED", "failed"),
+    (UIState, "IDLE", "idle"),
+    (UIState, "HOVERING", "hovering"),
+    (UIState, "DRAGGING", "dragging"),
+    (UIState, "SELECTING", "selecting"),
+    (UIState, "ANIMATING", "animating"),
+    (UIState, "DISABLED", "disabled"),
+    (UIState, "LOADING", "loading"),
+]
+
+
+class TestEnumDefinitions:
+    """Test enum members and values (table-driven)."""
+    
+    @pytest.mark.parametrize("enum_cls, expected", ENUM_COUNTS, ids=lambda v: getattr(v, "__name__", None))
+    def test_enum_count(self, enum_cls, expected):
+        """Test number of members."""
+        assert len(enum_cls) == expected
+    
+    @pytest.mark.parametrize(
+        "enum_cls, name, value", ENUM_VALUES,
+        ids=[f"{cls.__name__}.{name}" for cls, name, _ in ENUM_VALUES]
+    )
+    def test_enum_value(self, enum_cls, name, value):
+        """Test member value."""
+        assert enum_cls[name].value == value
     
     def test_player_type_iteration(self):
         """Test enum iteration."""
@@ -26,93 +82,6 @@ class TestPlayerType:
         assert PlayerType.AI in types
 
 
-class TestPlayerStatus:
-    """Test PlayerStatus enum."""
-    
-    def test_player_status_values(self):
-        """Test enum values."""
-        assert PlayerStatus.WAITING.value == "waiting"
-        assert PlayerStatus.PLAYING.value == "playing"
-        assert PlayerStatus.PASSED.value == "passed"
-        assert PlayerStatus.FINISHED.value == "finished"
-    
-    def test_player_status_count(self):
-        """Test number of player statuses."""
-        assert len(PlayerStatus) == 4
-
-
-class TestGameState:
-    """Test GameState enum."""
-    
-    def test_game_state_values(self):
-        """Test enum values."""
-        assert GameState.INITIALIZING.value == "initializing"
-        assert GameState.WAITING_START.value == "waiting_start"
-        assert GameState.PLAYING.value == "playing"
-        assert GameState.PAUSED.value == "paused"
-        assert GameState.FINISHED.value == "finished"
-        assert GameState.ABORTED.value == "aborted"
-    
-    def test_game_state_count(self):
-        """Test number of game states."""
-        assert len(GameState) == 6
-
-
-class TestTurnState:
-    """Test TurnState enum."""
-    
-    def test_turn_state_values(self):
-        """Test enum values."""
-        assert TurnState.STARTING.value == "starting"
-        assert TurnState.SELECTING_PIECE.value == "selecting_piece"
-        assert TurnState.PLACING_PIECE.value == "placing_piece"
-        assert TurnState.VALIDATING_MOVE.value == "validating_move"
-        assert TurnState.EXECUTING_MOVE.value == "executing_move"
-        assert TurnState.ENDING.value == "ending"
-        assert TurnState.PASSED.value == "passed"
-    
-    def test_turn_state_count(self):
-        """Test number of turn states."""
-        assert len(TurnState) == 7
-
-
-class TestMoveState:
-    """Test MoveState enum."""
-    
-    def test_move_state_values(self):
-        """Test enum values."""
-        assert MoveState.PROPOSED.value == "proposed"
-        assert MoveState.VALIDATING.value == "validating"
-        assert MoveState.VALID.value == "valid"
-        assert MoveState.INVALID.value == "invalid"
-        assert MoveState.EXECUTED.value == "executed"
-        assert MoveState.ANIMATING.value == "animating"
-        assert MoveState.COMPLETED.value == "completed"
-        assert MoveState.FAILED.value == "failed"
-    
-    def test_move_state_count(self):
-        """Test number of move states."""
-        assert len(MoveState) == 8
-
-
-class TestUIState:
-    """Test UIState enum."""
-    
-    def test_ui_state_values(self):
-        """Test enum values."""
-        assert UIState.IDLE.value == "idle"
-        assert UIState.HOVERING.value == "hovering"
-        assert UIState.DRAGGING.value == "dragging"
-        assert UIState.SELECTING.value == "selecting"
-        assert UIState.ANIMATING.value == "animating"
-        assert UIState.DISABLED.value == "disabled"
-        assert UIState.LOADING.value == "loading"
-    
-    def test_ui_state_count(self):
-        """Test number of UI states."""
-        assert len(UIState) == 7
-
-
 class TestEnumSerialization:
     """Test enum serialization and deserialization."""
     
@@ -5,65 +5,61 @@ These tests generate random game scenarios and verify that
 the game never crashes and maintains invariants.
 """
 
+import random
+
 import pytest
-from hypothesis import given, strategies as st, settings, assume
+from hypothesis import given, strategies as st, assume
 from blokus.game import Game, Move, GameStatus
+from blokus.board import BOARD_SIZE
 from blokus.pieces import PieceType
 from blokus.player_types import PlayerStatus
 
+from conftest import sample_valid_move
+
+
+# Shared RNG for picking moves (avoids per-iteration imports)
+_RNG = random.Random(0)
 
-# Custom strategies for Blokus
-@st.composite
-def valid_game_config(draw):
-    """Generate valid game configuration."""
-    num_players = draw(st.sampled_from([2, 4]))
-    starting_player = draw(st.integers(min_value=0, max_value=num_players - 1))
-    return {"num_players": num_players, "starting_player_idx": starting_player}
 
+# Config tables materialized once at import (not per Hypothesis draw)
+_PLAYER_COUNTS = (2, 4)
 
-@st.composite
-def random_piece_type(draw):
-    """Generate random piece type."""
-    return draw(st.sampled_from(list(PieceType)))
+# All valid (num_players, starting_player_idx) configurations
+_GAME_CONFIGS = tuple((n, i) for n in _PLAYER_COUNTS for i in range(n))
 
 
+@pytest.mark.xdist_group("game_invariants")
 class TestGameInvariants:
     """Test that game invariants hold under random operations."""
     
-    @given(valid_game_config())
-    @settings(max_examples=50)
-    def test_game_initialization_never_crashes(self, config):
+    @given(st.sampled_from(_GAME_CONFIGS))
+    def test_game_initialization_never_crashes(self, pristine_games, config):
         """Game initialization should never crash with valid config."""
-        game = Game(
-            num_players=config["num_players"],
-            starting_player_idx=config["starting_player_idx"]
-        )
+        num_players, starting_player_idx = config
+        game = pristine_games[config]
         
         # Invariants after initialization
-        assert game.num_players == config["num_players"]
-        assert game.current_player_idx == config["starting_player_idx"]
+        assert game.num_players == num_players
+        assert game.current_player_idx == starting_player_idx
         assert game.status == GameStatus.IN_PROGRESS
-        assert len(game.players) == config["num_players"]
-        assert all(len(p.remaining_pieces) == 21 for p in game.players)
+        assert len(game.players) == num_players
+        # No player can hold more than 21 pieces, so the sum pins each count
+        assert sum(p.pieces_count for p in game.players) == 21 * num_players
     
-    @given(st.sampled_from([2, 4]))
-    @settings(max_examples=20, deadline=None)
-    def test_random_valid_moves_never_crash(self, num_players):
+    @given(st.sampled_from(_PLAYER_COUNTS))
+    def test_random_valid_moves_never_crash(self, pristine_games, num_players):
         """Playing random valid moves should never crash."""
-        game = Game(num_players=num_players)
+        game = pristine_games[(num_players, 0)].copy()
         moves_played = 0
         max_moves = 50
         
         while game.status == GameStatus.IN_PROGRESS and moves_played < max_moves:
-            valid_moves = game.get_valid_moves()
+            # Pick a random valid move
+            move = sample_valid_move(game, _RNG)
             
-            if not valid_moves:
+            if move is None:
                 break
             
-            # Pick a random valid move
-            import random
-            move = random.choice(valid_moves)
-            
             # Play the move
             result = game.play_move(move)
             
@@ -77,11 +73,10 @@ class TestGameInvariants:
         assert game.status in [GameStatus.IN_PROGRESS, GameStatus.FINISHED]
         assert all(p.score <= 20 for p in game.players)  # Max score is 20
     
-    @given(st.sampled_from([2, 4]), st.integers(min_value=1, max_value=10))
-    @settings(max_examples=30, deadline=None)
-    def test_force_pass_maintains_invariants(self, num_players, num_passes):
+    @given(st.sampled_from(_PLAYER_COUNTS), st.integers(min_value=1, max_value=10))
+    def test_force_pass_maintains_invariants(self, pristine_games, num_players, num_passes):
         """Forcing passes should maintain game invariants."""
-        game = Game(num_players=num_players)
+        game = pristine_games[(num_players, 0)].copy()
         
         for _ in range(min(num_passes, num_players)):
             if game.status == GameStatus.IN_PROGRESS:
@@ -96,68 +91,60 @@ class TestGameInvariants:
         if num_passes >= num_players:
             assert game.status == GameStatus.FINISHED
     
-    @given(st.sampled_from([2, 4]))
-    @settings(max_examples=20, deadline=None)
-    def test_score_calculation_never_negative_beyond_limit(self, num_players):
+    @given(st.sampled_from(_PLAYER_COUNTS))
+    def test_score_calculation_never_negative_beyond_limit(self, pristine_games, num_players):
         """Scores should never be below -89 (all pieces remaining)."""
-        game = Game(num_players=num_players)
+        game = pristine_games[(num_players, 0)].copy()
         
         # Play some random moves
         for _ in range(10):
-            valid_moves = game.get_valid_moves()
-            if valid_moves:
-                import random
-                game.play_move(random.choice(valid_moves))
+            move = sample_valid_move(game, _RNG)
+            if move is not None:
+                game.play_move(move)
         
         scores = game.get_scores()
         
         for score in scores:
             assert -89 <= score <= 20, f"Score {score} out of valid range [-89, 20]"
     
-    @given(st.sampled_from([2, 4]))
-    @settings(max_examples=20, deadline=None)
-    def test_game_copy_is_independent(self, num_players):
+    @given(st.sampled_from(_PLAYER_COUNTS))
+    def test_game_copy_is_independent(self, pristine_games, num_players):
         """Copied game should be independent of original."""
-        game = Game(num_players=num_players)
+        game = pristine_games[(num_players, 0)].copy()
         
         # Play a few moves
         for _ in range(5):
-            valid_moves = game.get_valid_moves()
-            if valid_moves:
-                import random
-                game.play_move(random.choice(valid_moves))
+            move = sample_valid_move(game, _RNG)
+            if move is not None:
+                game.play_move(move)
         
         # Copy the game
         game_copy = game.copy()
         
         # Modify the copy
-        valid_moves = game_copy.get_valid_moves()
-        if valid_moves:
-            import random
-            game_copy.play_move(random.choice(valid_moves))
+        move = sample_valid_move(game_copy, _RNG)
+        if move is not None:
+            game_copy.play_move(move)
         
         # Original should be unchanged
-        assert game.turn_number != game_copy.turn_number or not valid_moves
+        assert game.board != game_copy.board or move is None
 
 
+@pytest.mark.xdist_group("player_invariants")
 class TestPlayerInvariants:
     """Test player-related invariants."""
     
-    @given(st.sampled_from([2, 4]))
-    @settings(max_examples=20, deadline=None)
-    def test_pieces_count_decreases_monotonically(self, num_players):
+    @given(st.sampled_from(_PLAYER_COUNTS))
+    def test_pieces_count_decreases_monotonically(self, pristine_games, num_players):
         """Pieces count should only decrease, never increase."""
-        game = Game(num_players=num_players)
+        game = pristine_games[(num_players, 0)].copy()
         
         pieces_counts = {p.id: p.pieces_count for p in game.players}
         
         for _ in range(20):
-            valid_moves = game.get_valid_moves()
-            if not valid_moves:
+            move = sample_valid_move(game, _RNG)
+            if move is None:
                 break
-            
-            import random
-            move = random.choice(valid_moves)
             player_id = move.player_id
             
             old_count = pieces_counts[player_id]
@@ -168,21 +155,17 @@ class TestPlayerInvariants:
             assert new_count == old_count - 1, "Pieces count should decrease by 1"
             pieces_counts[player_id] = new_count
     
-    @given(st.sampled_from([2, 4]))
-    @settings(max_examples=20, deadline=None)
-    def test_squares_remaining_decreases(self, num_players):
+    @given(st.sampled_from(_PLAYER_COUNTS))
+    def test_squares_remaining_decreases(self, pristine_games, num_players):
         """Squares remaining should only decrease."""
-        game = Game(num_players=num_players)
+        game = pristine_games[(num_players, 0)].copy()
         
         squares_remaining = {p.id: p.squares_remaining for p in game.players}
         
         for _ in range(20):
-            valid_moves = game.get_valid_moves()
-            if not valid_moves:
+            move = sample_valid_move(game, _RNG)
+            if move is None:
                 break
-            
-            import random
-            move = random.choice(valid_moves)
             player_id = move.player_id
             
             old_squares = squares_remaining[player_id]
@@ -194,52 +177,45 @@ class TestPlayerInvariants:
             squares_remaining[player_id] = new_squares
 
 
+@pytest.mark.xdist_group("board_invariants")
 class TestBoardInvariants:
     """Test board-related invariants."""
     
-    @given(st.sampled_from([2, 4]))
-    @settings(max_examples=20, deadline=None)
-    def test_board_cells_never_overlap(self, num_players):
+    @given(st.sampled_from(_PLAYER_COUNTS))
+    def test_board_cells_never_overlap(self, pristine_games, num_players):
         """Board cells should never be overwritten."""
-        game = Game(num_players=num_players)
+        game = pristine_games[(num_players, 0)].copy()
         
-        occupied_cells = set()
+        # Dense occupancy bitmap indexed by row * BOARD_SIZE + col
+        occupied = bytearray(BOARD_SIZE * BOARD_SIZE)
         
         for _ in range(30):
-            valid_moves = game.get_valid_moves()
-            if not valid_moves:
+            move = sample_valid_move(game, _RNG)
+            if move is None:
                 break
             
-            import random
-            move = random.choice(valid_moves)
-            
-            # Get piece positions
-            from blokus.pieces import get_piece
-            piece = get_piece(move.piece_type, move.orientation)
-            positions = piece.translate(move.row, move.col)
+            # Get piece positions (get_piece is memoized)
+            piece = move.get_piece()
             
             # Check no overlap
-            for pos in positions:
-                assert pos not in occupied_cells, f"Cell {pos} already occupied!"
-                occupied_cells.add(pos)
+            for r, c in piece.coords:
+                idx = (move.row + r) * BOARD_SIZE + move.col + c
+                assert occupied[idx] == 0, f"Cell {divmod(idx, BOARD_SIZE)} already occupied!"
+                occupied[idx] = 1
             
             game.play_move(move)
     
-    @given(st.sampled_from([2, 4]))
-    @settings(max_examples=20, deadline=None)
-    def test_board_occupied_count_increases(self, num_players):
+    @given(st.sampled_from(_PLAYER_COUNTS))
+    def test_board_occupied_count_increases(self, pristine_games, num_players):
         """Board occupied count should only increase."""
-        game = Game(num_players=num_players)
+        game = pristine_games[(num_players, 0)].copy()
         
         occupied_count = game.board.count_occupied()
         
         for _ in range(20):
-            valid_moves = game.get_valid_moves()
-            if not valid_moves:
+            move = sample_valid_move(game, _RNG)
+            if move is None:
                 break
-            
-            import random
-            move = random.choice(valid_moves)
             game.play_move(move)
             
             new_count = game.board.count_occupied()
@@ -253,26 +229,23 @@ class TestEdgeCases:
     """Test edge cases with property-based testing."""
     
     @given(st.integers(min_value=0, max_value=3))
-    @settings(max_examples=10)
-    def test_starting_player_invariant(self, starting_player):
+    def test_starting_player_invariant(self, pristine_games, starting_player):
         """Game should start with specified player."""
-        game = Game(num_players=4, starting_player_idx=starting_player)
+        game = pristine_games[(4, starting_player)]
         
         assert game.current_player_idx == starting_player
         assert game.current_player.status == PlayerStatus.PLAYING
     
-    @given(st.sampled_from([2, 4]))
-    @settings(max_examples=10)
-    def test_get_valid_moves_returns_valid_moves(self, num_players):
+    @given(st.sampled_from(_PLAYER_COUNTS))
+    def test_get_valid_moves_returns_valid_moves(self, pristine_games, num_players):
         """All moves returned by get_valid_moves should be valid."""
-        game = Game(num_players=num_players)
+        game = pristine_games[(num_players, 0)].copy()
         
         valid_moves = game.get_valid_moves()
         
         # Check a sample of moves
-        import random
         sample_size = min(10, len(valid_moves))
-        sample = random.sample(valid_moves, sample_size)
+        sample = _RNG.sample(valid_moves, sample_size)
         
         for move in sample:
             assert game.is_valid_move(move), f"Move {move} should be valid"
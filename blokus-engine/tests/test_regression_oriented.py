@@ -18,6 +18,8 @@ def test_orientation_determinism():
     # Generate second time
     orientations2 = _generate_all_orientations(base_shape)
     
+    # Cached: both calls return the very same object
+    assert orientations1 is orientations2 or orientations1 == orientations2
     assert len(orientations1) == len(orientations2)
     
     for i, (o1, o2) in enumerate(zip(orientations1, orientations2)):
@@ -36,10 +38,8 @@ def test_game_sequence_turn_1_and_2():
     move1_p0 = Move(0, PieceType.I1, 0, 0, 0)
     assert game.play_move(move1_p0) is True
     
-    # --- Skip others ---
-    game.pass_turn() # P1
-    game.pass_turn() # P2
-    game.pass_turn() # P3
+    # --- Skip others (P1, P2, P3) ---
+    game.skip_to_player(0)
     
     # --- Turn 2: Player 0 uses I2 ---
     # Connect to I1 at (0,0). Valid diagonal is (1,1).
@@ -61,7 +61,7 @@ def test_invalid_edge_connection_rejection():
     game.play_move(Move(0, PieceType.I1, 0, 0, 0))
     
     # Skip others
-    game.pass_turn(); game.pass_turn(); game.pass_turn()
+    game.skip_to_player(0)
     
     # P0 tries to place I2 edge-adjacent at (0, 1) (horizontal)
     # I1 covers (0,0). I2 at (0,1) covers (0,1), (0,2).
@@ -82,7 +82,7 @@ def test_invalid_no_corner_connection_rejection():
     game.play_move(Move(0, PieceType.I1, 0, 0, 0))
     
     # Skip others
-    game.pass_turn(); game.pass_turn(); game.pass_turn()
+    game.skip_to_player(0)
     
     # P0 tries to place I2 at (2, 2) (isolated)
     bad_move = Move(0, PieceType.I2, 0, 2, 2)
@@ -3,7 +3,10 @@
 import pytest
 from blokus.board import Board
 from blokus.pieces import get_piece, PieceType, PIECES
-from blokus.rules import is_valid_placement, get_valid_placements, has_valid_move
+from blokus.kernels import fits_kernel
+from blokus.rules import (
+    is_valid_placement, get_valid_placements, has_valid_move, find_valid_placements
+)
 
 
 class TestFirstMovePlacement:
@@ -189,3 +192,40 @@ class TestHasValidMove:
         # Actually it CAN be placed there! Let me reconsider...
         # First move just needs to cover starting corner, doesn't need diagonal contact
         assert has_valid_move(board, pieces, player_id=0, is_first_move=True)
+
+
+class TestFitsKernel:
+    """Test the grid kernel against the bitboard rules."""
+    
+    @pytest.mark.parametrize("is_first_move", [True, False])
+    def test_kernel_agrees_with_rules(self, is_first_move):
+        """Kernel and is_valid_placement agree on every origin."""
+        board = Board()
+        board.place_piece(get_piece(PieceType.L5), 0, 0, player_id=0)
+        board.place_piece(get_piece(PieceType.T4), 2, 2, player_id=1)
+        
+        for piece in PIECES[PieceType.V] + PIECES[PieceType.I1]:
+            for row in range(-1, 8):
+                for col in range(-1, 8):
+                    expected = is_valid_placement(board, piece, row, col, 0, is_first_move)
+                    assert fits_kernel(
+                        board.grid, piece.cells_array(), row, col, 0, is_first_move, 0, 0
+                    ) == expected
+
+
+class TestFindValidPlacements:
+    """Test the vectorized placement search."""
+    
+    @pytest.mark.parametrize("size, is_first_move", [(20, True), (20, False), (14, False)])
+    def test_matches_per_piece_search(self, size, is_first_move):
+        """Batched results equal get_valid_placements for every orientation."""
+        board = Board(size=size)
+        board.place_piece(get_piece(PieceType.L5), 0, 0, player_id=0)
+        board.place_piece(get_piece(PieceType.T4), 2, 2, player_id=1)
+        pieces = [piece for orientations in PIECES.values() for piece in orientations]
+        
+        found = find_valid_placements(board, pieces, 0, is_first_move).tolist()
+        
+        for k, piece in enumerate(pieces):
+            expected = get_valid_placements(board, piece, 0, is_first_move)
+            assert {(r, c) for i, r, c in found if i == k} == expected
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, field_validator
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple, TypedDict
 from enum import Enum
 
 # Remirror PieceType if we can't import directly, or use string/enums
@@ -49,6 +49,47 @@ class GameState(BaseModel):
     status: str
     turn_number: int
 
+class PlayerStateDict(TypedDict):
+    """PlayerState as a plain dict, for responses built by the server."""
+    id: int
+    name: str
+    color: str
+    type: str
+    persona: Optional[str]
+    pieces_remaining: List[str]
+    pieces_count: int
+    squares_remaining: int
+    score: int
+    has_passed: bool
+    status: str
+    display_name: str
+    turn_order: Optional[int]
+
+class GameStateDict(TypedDict):
+    """GameState as a plain dict (same JSON); serialized without pydantic."""
+    board: List[List[int]]
+    players: List[PlayerStateDict]
+    current_player_id: int
+    status: str
+    turn_number: int
+
+class GameStateDelta(BaseModel):
+    """
+    Partial GameState for turns that barely change the game (e.g. a pass).
+    
+    Clients merge it into their last full GameState: overwrite the scalar
+    fields, set has_passed for the players at passed_player_indices (player
+    list positions, like current_player_id, not player ids), take each
+    player's status from player_statuses, and write changed_cells
+    (row, col, value) into the board if present.
+    """
+    current_player_id: int
+    status: str
+    turn_number: int
+    passed_player_indices: List[int]
+    player_statuses: List[str]
+    changed_cells: Optional[List[Tuple[int, int, int]]] = None
+
 class MoveRequest(BaseModel):
     player_id: int
     piece_type: str
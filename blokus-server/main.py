@@ -1,21 +1,60 @@
 import sys
 import os
+from importlib.util import find_spec
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
-# Add engine to path (legacy support)
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../blokus-engine/src")))
+# The engine is normally installed (pip install -e blokus-engine) and found by
+# the regular import system; only patch sys.path for uninstalled checkouts
+try:
+    import blokus  # noqa: F401
+except ImportError:
+    sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../blokus-engine/src")))
 
 from version import BACKEND_VERSION
 from routes import game_routes, ai_routes, system_routes
 
+def _response_options() -> dict:
+    """
+    Use orjson-backed responses where they help.
+    
+    Recent FastAPI serializes response models straight to JSON bytes with
+    Pydantic and deprecates ORJSONResponse, so its default is kept there.
+    Older releases go through the stdlib json encoder, which orjson beats
+    several times over on the board payload.
+    """
+    if getattr(ORJSONResponse, "__deprecated__", None) is not None:
+        return {}
+    try:
+        import orjson  # noqa: F401
+    except ImportError:
+        return {}
+    return {"default_response_class": ORJSONResponse}
+
+
+def _server_options() -> dict:
+    """
+    Event loop and HTTP parser for uvicorn.run().
+    
+    uvicorn[standard] installs uvloop and httptools (uvloop is skipped on
+    Windows); pick them explicitly so the running config is not left to
+    auto-detection, and fall back to the pure-Python pair otherwise.
+    """
+    return {
+        "loop": "uvloop" if find_spec("uvloop") else "asyncio",
+        "http": "httptools" if find_spec("httptools") else "h11",
+    }
+
+
 def create_app() -> FastAPI:
     """Application Factory"""
     app = FastAPI(
         title="Blokus API", 
         description="API for Blokus Game Engine", 
-        version=BACKEND_VERSION
+        version=BACKEND_VERSION,
+        **_response_options()
     )
 
     # CORS Configuration
@@ -37,5 +76,17 @@ def create_app() -> FastAPI:
 app = create_app()
 
 if __name__ == "__main__":
-    print(f"🚀 Blokus Backend {BACKEND_VERSION} Starting...")
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
+    options = _server_options()
+    # Auto-reload is for development only: BLOKUS_RELOAD=1 python main.py
+    reload = os.environ.get("BLOKUS_RELOAD") == "1"
+    # Worker processes (ignored with reload). Each worker would hold its own
+    # GameService, so requests would hit different games: refuse more than one
+    # until games are partitioned per session.
+    workers = None if reload else int(os.environ.get("BLOKUS_WORKERS", "1"))
+    if workers is not None and workers > 1:
+        sys.exit(
+            f"BLOKUS_WORKERS={workers} is not supported: the game lives in process "
+            "memory, so every worker would serve a different game. Use 1 worker."
+        )
+    print(f"🚀 Blokus Backend {BACKEND_VERSION} Starting ({options['loop']}/{options['http']})...")
+    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=reload, workers=workers, **options)
@@ -1,36 +1,81 @@
-from api.models import GameState, PlayerState
+from typing import List, Optional, Tuple
+
+from api.models import GameStateDelta, GameStateDict, PlayerStateDict
 from blokus.game import Game
+from blokus.player_types import PLAYER_STATUS_VALUES, PLAYER_TYPE_VALUES
+
+def map_player_static_fields(game: Game) -> List[dict]:
+    """
+    The PlayerState fields that never change during a game, per player.
+    
+    Computed once per game (see GameService) and merged into each state.
+    """
+    return [
+        {
+            "id": p.id,
+            "name": p.name,
+            "color": p.color,
+            "type": PLAYER_TYPE_VALUES[p.type],
+            "persona": p.persona,
+            "display_name": p.display_name,
+            "turn_order": p.turn_order
+        }
+        for p in game.players
+    ]
+
 
-def map_game_to_state(game: Game) -> GameState:
-    """Map Game instance to API GameState model."""
+def map_game_to_state(
+    game: Game,
+    static_players: Optional[List[dict]] = None,
+    scores: Optional[List[int]] = None
+) -> GameStateDict:
+    """
+    Map Game instance to the API GameState, as a plain dict.
+    
+    Values come from the engine, not from clients, so there is nothing to
+    validate; plain dicts also skip pydantic's schema walk when serialized.
+    static_players (from map_player_static_fields) skips rebuilding the
+    fields that are fixed for the game; scores may likewise be passed in
+    when already known.
+    """
+    if static_players is None:
+        static_players = map_player_static_fields(game)
+    
     # Calculate scores for all players
-    scores = game.get_scores()
+    if scores is None:
+        scores = game.get_scores()
     
-    players_states = []
-    for i, p in enumerate(game.players):
-        # Convert set of PieceType to list of strings
-        pieces = sorted([pt.name for pt in p.remaining_pieces])
-        
-        players_states.append(PlayerState(
-            id=p.id,
-            name=p.name,
-            color=p.color,
-            type=p.type.value,
-            persona=p.persona,
-            pieces_remaining=pieces,
-            pieces_count=p.pieces_count,
-            squares_remaining=p.squares_remaining,
-            score=scores[i],
-            has_passed=p.has_passed,
-            status=p.status.value,
-            display_name=p.display_name,
-            turn_order=p.turn_order
-        ))
+    players_states: List[PlayerStateDict] = []
+    for static, p, score in zip(static_players, game.players, scores):
+        players_states.append({
+            **static,
+            "pieces_remaining": p.remaining_piece_names,
+            "pieces_count": p.pieces_count,
+            "squares_remaining": p.squares_remaining,
+            "score": score,
+            "has_passed": p.has_passed,
+            "status": PLAYER_STATUS_VALUES[p.status]
+        })
     
-    return GameState(
-        board=game.board.grid.tolist(),
-        players=players_states,
+    return {
+        "board": game.board.to_list(),
+        "players": players_states,
+        "current_player_id": game.current_player_idx,
+        "status": game.status.value,
+        "turn_number": game.turn_number
+    }
+
+
+def map_game_to_delta(
+    game: Game,
+    changed_cells: Optional[List[Tuple[int, int, int]]] = None
+) -> GameStateDelta:
+    """Map Game instance to a GameStateDelta (see its merge contract)."""
+    return GameStateDelta.model_construct(
         current_player_id=game.current_player_idx,
         status=game.status.value,
-        turn_number=game.turn_number
+        turn_number=game.turn_number,
+        passed_player_indices=[i for i, p in enumerate(game.players) if p.has_passed],
+        player_statuses=[PLAYER_STATUS_VALUES[p.status] for p in game.players],
+        changed_cells=changed_cells
     )
@@ -1,14 +1,24 @@
-from fastapi import APIRouter
-from typing import List
+from fastapi import APIRouter, Response
+from typing import List, Optional, Tuple
+import orjson
 from api.models import AIModelInfo
 from blokus.rl.registry import get_registry
 
 router = APIRouter(prefix="/ai", tags=["AI"])
 
+# (registry.json mtime, serialized model list) of the last response
+_models_cache: Optional[Tuple[Optional[int], bytes]] = None
+
 @router.get("/models", response_model=List[AIModelInfo])
 def list_ai_models():
     """List all available AI models/personas."""
+    global _models_cache
     registry = get_registry()
-    # Force reload to get latest updates (e.g. newly trained models)
-    registry.reload()
-    return registry.list_for_api(only_enabled=True)
+    # Pick up registry edits (e.g. newly trained models) without re-reading
+    # the file on every request
+    registry.reload_if_changed()
+    cached = _models_cache
+    if cached is None or cached[0] != registry.loaded_mtime_ns:
+        body = orjson.dumps(registry.list_for_api(only_enabled=True))
+        cached = _models_cache = (registry.loaded_mtime_ns, body)
+    return Response(content=cached[1], media_type="application/json")
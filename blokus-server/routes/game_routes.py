@@ -1,22 +1,79 @@
-from fastapi import APIRouter, Depends, HTTPException
-from blokus.pieces import PieceType
+import asyncio
+from typing import Optional, Union
+
+import orjson
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from blokus.pieces import PIECE_TYPE_BY_NAME
 from blokus.game import Move
 from blokus.player_types import PlayerType
 from blokus.rl.registry import get_registry
 from blokus.rl.observations import create_observation
 from blokus.rl.actions import get_action_mask, decode_action
 
-from api.models import GameState, MoveRequest, MoveResponse, CreateGameRequest
-from services.game_service import GameService, get_game_service
-from mappers import map_game_to_state
+from api.models import GameState, GameStateDelta, GameStateDict, MoveRequest, MoveResponse, CreateGameRequest
+from services.game_service import GameService
+from mappers import map_game_to_delta
 
 router = APIRouter(prefix="/game", tags=["Game"])
 
+# Process-wide singleton, bound once instead of resolved per request
+SERVICE = GameService.get_instance()
+
+# Validates /game/move bodies straight from the raw JSON bytes
+MOVE_ADAPTER = TypeAdapter(MoveRequest)
+
+
+def _json_response(content: Union[BaseModel, dict]) -> Response:
+    """
+    Serialize a response model or plain-dict payload straight to JSON bytes.
+    
+    Returning a Response skips FastAPI's jsonable_encoder pass and the
+    re-validation against response_model (kept on the routes for the
+    OpenAPI schema); payloads are built from engine state.
+    """
+    if isinstance(content, BaseModel):
+        body = content.model_dump_json()
+    else:
+        body = orjson.dumps(content)
+    return Response(content=body, media_type="application/json")
+
+
+def _move_response(
+    success: bool,
+    message: Optional[str] = None,
+    game_state: Optional[GameStateDict] = None,
+    move: Optional[MoveRequest] = None
+) -> Response:
+    """MoveResponse JSON carrying a mapped GameStateDict."""
+    return _json_response({
+        "success": success,
+        "message": message,
+        "game_state": game_state,
+        "move": move.model_dump() if move is not None else None
+    })
+
+
+def _state_response(service: GameService, request: Optional[Request] = None) -> Response:
+    """
+    Current GameState, rendered once per game change (see state_json).
+    
+    Carries an ETag so polling clients can revalidate: if request already
+    holds the current state (If-None-Match), answer 304 with no body.
+    """
+    # no-cache: browsers keep the body but revalidate on every poll
+    headers = {"Cache-Control": "no-cache"}
+    with service.lock:
+        headers["ETag"] = service.state_etag()
+        if request is not None and request.headers.get("if-none-match") == headers["ETag"]:
+            return Response(status_code=304, headers=headers)
+        body = service.state_json()
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 @router.post("/new", response_model=GameState)
-def create_game(
-    request: CreateGameRequest, 
-    service: GameService = Depends(get_game_service)
-):
+def create_game(request: CreateGameRequest):
     """Create a new game with configured players."""
     # Determine configuration
     mode = request.two_player_mode.strip().lower() if request.two_player_mode else 'standard'
@@ -34,7 +91,7 @@ def create_game(
             player_configs.append(conf)
             
     # Create game via service
-    game = service.create_game(
+    SERVICE.create_game(
         num_players=len(player_configs) if player_configs else request.num_players,
         players_config=player_configs,
         board_size=board_size,
@@ -42,69 +99,125 @@ def create_game(
         mode=mode
     )
     
-    return map_game_to_state(game)
+    return _state_response(SERVICE)
 
 @router.get("/state", response_model=GameState)
-def get_state(service: GameService = Depends(get_game_service)):
-    """Get current game state."""
-    return map_game_to_state(service.game)
-
-@router.post("/move", response_model=MoveResponse)
-def make_move(
-    move_req: MoveRequest, 
-    service: GameService = Depends(get_game_service)
-):
-    """Execute a move."""
-    game = service.game
+def get_state(request: Request):
+    """
+    Get current game state.
+    
+    Sync on purpose: it waits on SERVICE.lock, which worker threads hold
+    while they play moves or build AI masks.
+    """
+    return _state_response(SERVICE, request)
+
+@router.post(
+    "/move",
+    response_model=MoveResponse,
+    # The body is parsed by hand below; document it for OpenAPI
+    openapi_extra={"requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": MoveRequest.model_json_schema()}}
+    }}
+)
+async def make_move(request: Request):
+    """
+    Execute a move.
     
+    The body goes through pydantic-core in one validate_json() call instead
+    of FastAPI's json.loads + model validation; the move itself runs in a
+    worker thread, as the handler used to.
+    """
     try:
-        piece_type = PieceType[move_req.piece_type]
-        move = Move(
-            player_id=move_req.player_id,
-            piece_type=piece_type,
-            orientation=move_req.orientation,
-            row=move_req.row,
-            col=move_req.col
-        )
-        
+        move_req = MOVE_ADAPTER.validate_json(await request.body())
+    except ValidationError as e:
+        # Same error locations FastAPI reports for body models
+        raise RequestValidationError([{**err, "loc": ("body", *err["loc"])} for err in e.errors()])
+    return await asyncio.to_thread(_play_move, move_req)
+
+def _play_move(move_req: MoveRequest) -> Response:
+    """Validate and play a requested move."""
+    piece_type = PIECE_TYPE_BY_NAME.get(move_req.piece_type)
+    if piece_type is None:
+        return _move_response(False, message=f"Invalid piece type: {move_req.piece_type}")
+    
+    # The engine reports bad moves as rejection reasons, not exceptions
+    move = Move(
+        player_id=move_req.player_id,
+        piece_type=piece_type,
+        orientation=move_req.orientation,
+        row=move_req.row,
+        col=move_req.col
+    )
+    
+    # Read the game under the lock: /game/new may swap it concurrently
+    with SERVICE.lock:
+        game = SERVICE.game
         rejection = game.get_move_rejection_reason(move)
         if rejection:
-            return MoveResponse(success=False, message=rejection)
-            
-        success = game.play_move(move)
+            return _move_response(False, message=rejection)
         
-        if success:
-            return MoveResponse(success=True, game_state=map_game_to_state(game))
-        else:
-            return MoveResponse(success=False, message="Board placement failed")
-            
-    except KeyError:
-        return MoveResponse(success=False, message=f"Invalid piece type: {move_req.piece_type}")
-    except Exception as e:
-        return MoveResponse(success=False, message=f"Server error: {str(e)}")
+        try:
+            success = game.play_move(move)
+        except Exception as e:
+            return _move_response(False, message=f"Server error: {str(e)}")
+        if not success:
+            return _move_response(False, message="Board placement failed")
+        game_state = SERVICE.state_dict()
+    
+    return _move_response(True, game_state=game_state)
 
-@router.post("/pass", response_model=GameState)
-def pass_turn(service: GameService = Depends(get_game_service)):
-    """Pass turn for current player."""
-    game = service.game
-    game.pass_turn()
-    return map_game_to_state(game)
+@router.post("/pass", response_model=GameStateDelta)
+def pass_turn():
+    """
+    Pass turn for current player (the board is unchanged: returns a delta).
+    
+    Sync: passing takes SERVICE.lock and enumerates the next player's moves.
+    """
+    with SERVICE.lock:
+        game = SERVICE.game
+        game.pass_turn()
+        delta = map_game_to_delta(game)
+    return _json_response(delta)
 
 @router.post("/reset", response_model=GameState)
-def reset_game(service: GameService = Depends(get_game_service)):
+def reset_game():
     """Reset game keeping same configuration."""
-    game = service.reset_game()
-    return map_game_to_state(game)
+    SERVICE.reset_game()
+    return _state_response(SERVICE)
 
 @router.post("/ai/suggest", response_model=MoveResponse)
-def suggest_move(service: GameService = Depends(get_game_service)):
-    """Get AI move suggestion."""
-    game = service.game
-    current_player = game.players[game.current_player_idx]
+async def suggest_move():
+    """
+    Get AI move suggestion.
+    
+    Agent loading (possibly from disk), mask building, inference and the
+    forced pass all run in a worker thread, so the event loop keeps serving
+    other requests (e.g. /game/state polling).
+    """
+    return await asyncio.to_thread(_suggest_move)
+
+def _check_state_unchanged(state_key: tuple) -> None:
+    """
+    Fail the request if the game moved on since state_key was read.
+    
+    Call under SERVICE.lock. The key covers new games, resets, moves and
+    passes, so the suggestion is never applied to a different turn.
+    """
+    if SERVICE._state_key() != state_key:
+        raise HTTPException(status_code=409, detail="Game changed during AI suggestion")
+
+def _suggest_move() -> Response:
+    """Pick the current AI player's move, passing for it if it has none."""
+    with SERVICE.lock:
+        game = SERVICE.game
+        current_player = game.players[game.current_player_idx]
+        state_key = SERVICE._state_key()
     
     if current_player.type != PlayerType.AI:
         raise HTTPException(status_code=400, detail="Current player is not AI")
         
+    # Only agent loading and inference can fail unexpectedly
     try:
         registry = get_registry()
         persona = current_player.persona or "random"
@@ -112,35 +225,43 @@ def suggest_move(service: GameService = Depends(get_game_service)):
             agent = registry.load_agent(persona)
         except ValueError:
             agent = registry.load_agent("random")
-            
-        obs = create_observation(game)
-        mask = get_action_mask(game)
         
-        if not mask.any():
+        with SERVICE.lock:
+            _check_state_unchanged(state_key)
+            obs, mask = create_observation(game), get_action_mask(game)
+        action = None
+        if mask.any():
+            action = agent.select_action(obs, mask)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"AI Error: {str(e)}")
+    
+    with SERVICE.lock:
+        _check_state_unchanged(state_key)
+        if action is None:
+            # No legal move
             game.force_pass()
-            return MoveResponse(
-                success=True,
-                game_state=map_game_to_state(game),
+            return _move_response(
+                True,
+                game_state=SERVICE.state_dict(),
                 message="passed"
             )
-            
-        action = agent.select_action(obs, mask)
-        move = decode_action(action, game)
         
+        move = decode_action(action, game)
         if move is None:
-            raise ValueError("Agent selected invalid action")
-            
-        return MoveResponse(
-            success=True,
-            game_state=map_game_to_state(game),
-            message=f"suggested {move.piece_type.name}",
-            move=MoveRequest(
-                player_id=move.player_id,
-                piece_type=move.piece_type.name,
-                orientation=move.orientation,
-                row=move.row,
-                col=move.col
-            )
+            raise HTTPException(status_code=500, detail="AI Error: Agent selected invalid action")
+        game_state = SERVICE.state_dict()
+        
+    return _move_response(
+        True,
+        game_state=game_state,
+        message=f"suggested {move.piece_type.name}",
+        move=MoveRequest.model_construct(
+            player_id=move.player_id,
+            piece_type=move.piece_type.name,
+            orientation=move.orientation,
+            row=move.row,
+            col=move.col
         )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"AI Error: {str(e)}")
+    )
@@ -1,5 +1,6 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 import os
+import orjson
 from datetime import datetime
 from version import BACKEND_VERSION
 
@@ -8,11 +9,14 @@ router = APIRouter(tags=["System"])
 PID = os.getpid()
 START_TIME = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
+ROOT_BODY = orjson.dumps({
+    "message": f"Welcome to Blokus API {BACKEND_VERSION}", 
+    "version": BACKEND_VERSION,
+    "pid": PID,
+    "started_at": START_TIME
+})
+
 @router.get("/")
-def read_root():
-    return {
-        "message": f"Welcome to Blokus API {BACKEND_VERSION}", 
-        "version": BACKEND_VERSION,
-        "pid": PID,
-        "started_at": START_TIME
-    }
+async def read_root():
+    # Health checks hit this often; the body never changes for a process
+    return Response(content=ROOT_BODY, media_type="application/json")
@@ -1,10 +1,15 @@
-from typing import Optional, List
+import threading
+import orjson
+from typing import Optional, List, Tuple
 from fastapi import HTTPException
 
 from blokus.game import Game
 from blokus.board import Board
 from blokus.game_manager_factory import GameManagerFactory
 
+from api.models import GameStateDict
+from mappers import map_game_to_state, map_player_static_fields
+
 class GameService:
     """
     Singleton service to manage the global game state.
@@ -15,6 +20,16 @@ class GameService:
     def __init__(self):
         self._game: Optional[Game] = None
         self._mode: str = 'standard'  # Track game mode for reset
+        # Serializes game mutations across worker threads (AI runs off-loop)
+        self.lock = threading.RLock()
+        # Bumped for every new game so state keys never repeat across games
+        self._generation = 0
+        # Fixed PlayerState fields of the current game (see mappers)
+        self._static_players: List[dict] = []
+        # ((generation, turn number), scores): scores only move with moves
+        self._scores_cache: Optional[Tuple[Tuple[int, int], List[int]]] = None
+        # (state key, GameState JSON) of the last rendered state
+        self._state_cache: Optional[Tuple[tuple, bytes]] = None
     
     @classmethod
     def get_instance(cls) -> 'GameService':
@@ -28,6 +43,58 @@ class GameService:
             raise HTTPException(status_code=404, detail="Game not initialized")
         return self._game
     
+    def _state_key(self) -> tuple:
+        """Identifies the current state: changes on every move, pass or new game."""
+        game = self.game
+        passed = 0
+        for i, p in enumerate(game.players):
+            if p.has_passed:
+                passed |= 1 << i
+        return (
+            self._generation,
+            game.turn_number,
+            game.status.value,
+            game.current_player_idx,
+            passed
+        )
+    
+    def state_etag(self) -> str:
+        """Weak HTTP ETag of the current state (no rendering needed)."""
+        with self.lock:
+            key = self._state_key()
+        return 'W/"' + "-".join(str(part) for part in key) + '"'
+    
+    def scores(self) -> List[int]:
+        """Scores of the current game, recomputed only after a move."""
+        with self.lock:
+            game = self.game
+            key = (self._generation, game.turn_number)
+            cached = self._scores_cache
+            if cached is None or cached[0] != key:
+                cached = self._scores_cache = (key, game.get_scores())
+            return cached[1]
+    
+    def state_dict(self) -> GameStateDict:
+        """Current GameState as a plain dict."""
+        with self.lock:
+            return map_game_to_state(self.game, self._static_players, self.scores())
+    
+    def state_json(self) -> bytes:
+        """
+        Current GameState as JSON bytes.
+        
+        The UI polls the state between moves, so the rendering is reused
+        until a move, pass or new game changes the state key.
+        """
+        with self.lock:
+            key = self._state_key()
+            cached = self._state_cache
+            if cached is not None and cached[0] == key:
+                return cached[1]
+            payload = orjson.dumps(self.state_dict())
+            self._state_cache = (key, payload)
+            return payload
+    
     def create_game(self, 
                     num_players: int, 
                     players_config: Optional[List[dict]] = None, 
@@ -57,37 +124,31 @@ class GameService:
                 starting_player_id=starting_player_id
             )
         
-        # Store mode for reset
-        self._mode = mode
-        self._game = Game(game_manager=game_manager, board=board)
-        return self._game
+        game = Game(game_manager=game_manager, board=board)
+        static_players = map_player_static_fields(game)
+        
+        # Swap in the new game atomically with respect to moves and polls
+        with self.lock:
+            # Store mode for reset
+            self._mode = mode
+            self._state_cache = None
+            self._generation += 1
+            self._static_players = static_players
+            self._game = game
+        return game
     
     def reset_game(self) -> Game:
-        """Reset the current game keeping players and config."""
-        if not self._game:
-            return self.create_game(num_players=4) # Default fallback
-            
-        old_game = self._game
+        """
+        Reset the current game keeping players and config.
         
-        # Extract config to recreate similar game
-        player_configs = []
-        for p in old_game.players:
-            config = {
-                "id": p.id,
-                "name": p.name,
-                "type": p.type.value,
-            }
-            if p.persona:
-                config["persona"] = p.persona
-            player_configs.append(config)
-            
-        return self.create_game(
-            num_players=len(old_game.players),
-            players_config=player_configs,
-            board_size=old_game.board.size,
-            mode=self._mode
-        )
-
-# Dependency provider
-def get_game_service() -> GameService:
-    return GameService.get_instance()
+        The game is restarted in place (same board buffer and players), so
+        only the state cache needs to go.
+        """
+        with self.lock:
+            game = self._game
+            if game is None:
+                return self.create_game(num_players=4) # Default fallback
+            game.reset_in_place()
+            self._state_cache = None
+            self._generation += 1
+            return game
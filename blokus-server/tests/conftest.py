@@ -0,0 +1,13 @@
+"""Shared fixtures for the API tests."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+
+
+@pytest.fixture(scope="session")
+def client():
+    """One TestClient (and app lifespan) for the whole test session."""
+    with TestClient(app) as test_client:
+        yield test_client
@@ -16,12 +16,18 @@ from unittest.mock import Mock, patch, MagicMock
 from blokus_server.main import app, game_instance
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client():
-    """Create test client"""
+    """Create test client (shared: the app is stateless apart from the game)"""
     return TestClient(app)
 
 
+@pytest.fixture(autouse=True)
+def fresh_game(client):
+    """Start every test from a reset game"""
+    client.post("/game/reset")
+
+
 @pytest.fixture
 def game_config():
     """Create test game configuration"""
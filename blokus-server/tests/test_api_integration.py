@@ -4,13 +4,15 @@ import sys
 import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../blokus-engine/src")))
 
-from fastapi.testclient import TestClient
-from main import app
+# Fields every player entry of a GameState must carry
+REQUIRED_PLAYER_FIELDS = frozenset({
+    "id", "name", "color", "type", "pieces_remaining",
+    "pieces_count", "squares_remaining", "score",
+    "has_passed", "status", "display_name"
+})
 
-client = TestClient(app)
 
-
-def test_create_game_default():
+def test_create_game_default(client):
     """Test creating a game with default players."""
     response = client.post("/game/new", json={"num_players": 4})
     
@@ -34,7 +36,7 @@ def test_create_game_default():
     assert player["squares_remaining"] == 89
 
 
-def test_create_game_with_player_configs():
+def test_create_game_with_player_configs(client):
     """Test creating a game with custom player configurations."""
     request_data = {
         "num_players": 4,
@@ -66,7 +68,7 @@ def test_create_game_with_player_configs():
     assert data["players"][1]["status"] == "playing"
 
 
-def test_get_game_state():
+def test_get_game_state(client):
     """Test getting game state."""
     # Create a game first
     client.post("/game/new", json={"num_players": 2})
@@ -82,36 +84,223 @@ def test_get_game_state():
     assert "current_player_id" in data
 
 
-def test_player_state_includes_all_fields():
+def test_player_state_includes_all_fields(client):
     """Test that player state includes all new fields."""
     response = client.post("/game/new", json={"num_players": 4})
     data = response.json()
     
     player = data["players"][0]
     
-    # Check all required fields
-    required_fields = [
-        "id", "name", "color", "type", "pieces_remaining",
-        "pieces_count", "squares_remaining", "score", 
-        "has_passed", "status", "display_name"
-    ]
+    # Check all required fields (reports every missing one at once)
+    missing = REQUIRED_PLAYER_FIELDS - player.keys()
+    assert not missing, f"Missing fields: {sorted(missing)}"
+
+
+def test_pass_returns_delta(client):
+    """Passing returns a GameStateDelta rather than the full state."""
+    client.post("/game/new", json={"num_players": 4})
+    
+    response = client.post("/game/pass")
     
-    for field in required_fields:
-        assert field in player, f"Missing field: {field}"
+    assert response.status_code == 200
+    data = response.json()
+    assert "board" not in data
+    assert data["current_player_id"] == 1
+    assert data["passed_player_indices"] == [0]
+    assert data["player_statuses"] == ["waiting", "playing", "waiting", "waiting"]
+    assert data["changed_cells"] is None
 
 
-if __name__ == "__main__":
-    print("Running API tests...")
-    test_create_game_default()
-    print("✓ test_create_game_default passed")
+def test_delta_uses_player_indices_not_ids():
+    """passed_player_indices lines up with current_player_id for any ids."""
+    from blokus.game import Game
+    from blokus.game_manager_factory import GameManagerFactory
+    from mappers import map_game_to_delta
+    
+    game_manager = GameManagerFactory.create_from_config([
+        {"id": 3, "name": "Alice", "color": "blue"},
+        {"id": 7, "name": "Bob", "color": "red"}
+    ], starting_player_id=3)
+    game = Game(game_manager=game_manager)
+    game.pass_turn()
+    
+    delta = map_game_to_delta(game)
+    
+    assert delta.current_player_id == 1
+    assert delta.passed_player_indices == [0]
+    assert delta.player_statuses == ["waiting", "playing"]
+
+
+def test_state_matches_response_model(client):
+    """Pre-serialized state is JSON that validates as a GameState."""
+    from api.models import GameState
+    
+    client.post("/game/new", json={"num_players": 4})
+    response = client.get("/game/state")
+    
+    assert response.headers["content-type"] == "application/json"
+    state = GameState.model_validate(response.json())
+    assert len(state.board) == 20 and len(state.players) == 4
+
+
+def test_state_json_reused_until_game_changes(client):
+    """Polling an unchanged game reuses the rendered state."""
+    from services.game_service import GameService
+    
+    client.post("/game/new", json={"num_players": 4})
+    service = GameService.get_instance()
+    first = service.state_json()
+    assert service.state_json() is first
+    
+    client.post("/game/pass")
+    after_pass = service.state_json()
+    assert after_pass is not first
+    assert client.get("/game/state").content == after_pass
+
+
+def test_move_response_matches_response_model(client):
+    """Plain-dict move responses keep the MoveResponse shape."""
+    from api.models import MoveResponse
+    
+    client.post("/game/new", json={"num_players": 4})
+    response = client.post(
+        "/game/move",
+        json={"player_id": 0, "piece_type": "I1", "orientation": 0, "row": 0, "col": 0}
+    )
+    
+    result = MoveResponse.model_validate(response.json())
+    assert result.success
+    assert result.game_state.board[0][0] == 1
+    assert result.game_state.current_player_id == 1
+
+
+def test_state_etag_revalidation(client):
+    """Polling with the current ETag gets 304; a change gets a new body."""
+    client.post("/game/new", json={"num_players": 4})
+    first = client.get("/game/state")
+    etag = first.headers["etag"]
+    
+    unchanged = client.get("/game/state", headers={"If-None-Match": etag})
+    assert unchanged.status_code == 304
+    assert unchanged.content == b""
+    
+    client.post("/game/pass")
+    changed = client.get("/game/state", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert changed.json()["players"][0]["has_passed"]
+
+
+def test_reset_restarts_same_players(client):
+    """Reset clears the board in place and keeps the configured players."""
+    client.post("/game/new", json={"num_players": 4})
+    client.post(
+        "/game/move",
+        json={"player_id": 0, "piece_type": "I1", "orientation": 0, "row": 0, "col": 0}
+    )
+    state = client.get("/game/state")
+    etag = state.headers["etag"]
+    assert state.json()["players"][0]["score"] == -88
+    
+    data = client.post("/game/reset").json()
+    
+    assert data["board"][0][0] == 0
+    assert data["turn_number"] == 0
+    assert data["current_player_id"] == 0
+    assert len(data["players"][0]["pieces_remaining"]) == 21
+    assert data["players"][0]["score"] == -89
+    assert client.get("/game/state", headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_move_rejects_malformed_body(client):
+    """Hand-parsed move bodies still get FastAPI's 422 errors."""
+    client.post("/game/new", json={"num_players": 4})
+    
+    missing = client.post("/game/move", json={"player_id": 0, "piece_type": "I1"})
+    assert missing.status_code == 422
+    assert {tuple(e["loc"]) for e in missing.json()["detail"]} == {
+        ("body", "orientation"), ("body", "row"), ("body", "col")
+    }
+    
+    broken = client.post("/game/move", content=b"{not json", headers={"Content-Type": "application/json"})
+    assert broken.status_code == 422
+
+
+
+def test_suggest_rejects_move_played_during_inference(client, monkeypatch):
+    """A move landing while the agent thinks makes the suggestion a 409."""
+    import routes.game_routes as game_routes
+    from blokus.game import Move
+    from blokus.pieces import PieceType
+    from services.game_service import GameService
+    
+    client.post("/game/new", json={
+        "num_players": 2,
+        "players": [
+            {"name": "Bot", "type": "ai", "persona": "random"},
+            {"name": "Alice", "type": "human"}
+        ]
+    })
+    service = GameService.get_instance()
+    
+    class MoveInBetweenAgent:
+        def select_action(self, obs, mask):
+            # Another request plays for the AI while inference runs
+            with service.lock:
+                assert service.game.play_move(Move(0, PieceType.I1, 0, 0, 0))
+            return int(mask.nonzero()[0][0])
     
-    test_create_game_with_player_configs()
-    print("✓ test_create_game_with_player_configs passed")
+    class Registry:
+        def load_agent(self, persona):
+            return MoveInBetweenAgent()
     
-    test_get_game_state()
-    print("✓ test_get_game_state passed")
+    monkeypatch.setattr(game_routes, "get_registry", Registry)
     
-    test_player_state_includes_all_fields()
-    print("✓ test_player_state_includes_all_fields passed")
+    response = client.post("/game/ai/suggest")
+    
+    assert response.status_code == 409
+    state = client.get("/game/state").json()
+    assert state["turn_number"] == 1
+    assert state["current_player_id"] == 1
+
+
+if __name__ == "__main__":
+    from fastapi.testclient import TestClient
+    from main import app
+    
+    print("Running API tests...")
+    with TestClient(app) as client:
+        test_create_game_default(client)
+        print("✓ test_create_game_default passed")
+        
+        test_create_game_with_player_configs(client)
+        print("✓ test_create_game_with_player_configs passed")
+        
+        test_get_game_state(client)
+        print("✓ test_get_game_state passed")
+        
+        test_player_state_includes_all_fields(client)
+        print("✓ test_player_state_includes_all_fields passed")
+        
+        test_pass_returns_delta(client)
+        print("✓ test_pass_returns_delta passed")
+        
+        test_state_matches_response_model(client)
+        print("✓ test_state_matches_response_model passed")
+        
+        test_state_json_reused_until_game_changes(client)
+        print("✓ test_state_json_reused_until_game_changes passed")
+        
+        test_move_response_matches_response_model(client)
+        print("✓ test_move_response_matches_response_model passed")
+        
+        test_state_etag_revalidation(client)
+        print("✓ test_state_etag_revalidation passed")
+        
+        test_reset_restarts_same_players(client)
+        print("✓ test_reset_restarts_same_players passed")
+        
+        test_move_rejects_malformed_body(client)
+        print("✓ test_move_rejects_malformed_body passed")
     
     print("\n✅ All API tests passed!")
@@ -1,11 +1,14 @@
 """Tests for the API models and game creation."""
 
 import pytest
-from fastapi.testclient import TestClient
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from api.models import CreateGameRequest, PlayerConfig
 
+# Validation-only checks reuse one adapter per model
+_REQ_ADAPTER = TypeAdapter(CreateGameRequest)
+_PC_ADAPTER = TypeAdapter(PlayerConfig)
+
 
 class TestCreateGameRequest:
     """Test CreateGameRequest model."""
@@ -39,19 +42,15 @@ class TestCreateGameRequest:
         assert request.players[0].name == "Alice"
         assert request.players[1].persona == "random"
 
-    def test_invalid_start_player_raises_error(self):
+    @pytest.mark.parametrize("num_players, start_player", [
+        (4, -1),  # Negative start player
+        (4, 4),   # Start player too high
+        (2, 2),   # Start player too high for 2-player game
+    ])
+    def test_invalid_start_player_raises_error(self, num_players, start_player):
         """Invalid start_player should raise validation error."""
-        # Negative start player
-        with pytest.raises(ValidationError):
-            CreateGameRequest(num_players=4, start_player=-1)
-            
-        # Start player too high
-        with pytest.raises(ValidationError):
-            CreateGameRequest(num_players=4, start_player=4)
-            
-        # Start player too high for 2-player game
         with pytest.raises(ValidationError):
-            CreateGameRequest(num_players=2, start_player=2)
+            _REQ_ADAPTER.validate_python({"num_players": num_players, "start_player": start_player})
 
     def test_start_player_with_two_player_mode(self):
         """Start player should work with 2-player games."""
@@ -94,4 +93,4 @@ class TestPlayerConfig:
     def test_invalid_player_type(self):
         """Invalid player type should raise validation error."""
         with pytest.raises(ValidationError):
-            PlayerConfig(name="Invalid", type="invalid_type")
+            _PC_ADAPTER.validate_python({"name": "Invalid", "type": "invalid_type"})
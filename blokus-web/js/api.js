@@ -104,6 +104,8 @@ export async function createGame(numPlayers = 4, startPlayer = 0, players = null
 
 /**
  * Get current game state.
+ * The server sends an ETag with Cache-Control: no-cache, so the browser's
+ * HTTP cache revalidates each poll and an unchanged state costs a bodiless 304.
  * @returns {Promise<Object>} Current game state
  */
 export async function getGameState() {
@@ -134,7 +136,7 @@ export async function playMove(playerId, pieceType, orientation, row, col) {
 
 /**
  * Pass the current player's turn.
- * @returns {Promise<Object>} Updated game state
+ * @returns {Promise<Object>} GameStateDelta to merge into the last full state
  */
 export async function passTurn() {
     return _request('/game/pass', { method: 'POST' });
@@ -384,8 +384,8 @@ export class Game {
      */
     passTurn() {
         if (this._useApi) {
-            return this._apiClient.passTurn().then(state => {
-                this._syncFromServerState(state);
+            return this._apiClient.passTurn().then(delta => {
+                this._applyServerDelta(delta);
                 this._controls.clearSelection();
                 return true;
             }).catch(err => {
@@ -449,6 +449,7 @@ export class Game {
                 persona: p.persona,
                 remainingPieces: new Set(p.pieces_remaining),
                 hasPassed: p.has_passed,
+                status: p.status,
                 lastPieceWasMonomino: false
             }));
 
@@ -463,12 +464,49 @@ export class Game {
                 if (localPlayer) {
                     localPlayer.remainingPieces = new Set(p.pieces_remaining);
                     localPlayer.hasPassed = p.has_passed;
+                    localPlayer.status = p.status;
                     // Reset transient state that server doesn't track strictly or logic differs
                     localPlayer.lastPieceWasMonomino = false;
                 }
             });
         }
 
+        this._finishServerSync(serverState);
+    }
+
+    /**
+     * Merge a GameStateDelta (e.g. from /game/pass) into local state
+     * @param {Object} delta - current_player_id, status, turn_number,
+     *   passed_player_indices, player_statuses (both by player index)
+     *   and optional changed_cells [row, col, value]
+     * @private
+     */
+    _applyServerDelta(delta) {
+        this._playerStates.forEach(ps => ps.deactivate());
+
+        if (delta.changed_cells && delta.changed_cells.length) {
+            const grid = this._board.getGrid();
+            for (const [row, col, value] of delta.changed_cells) {
+                grid[row][col] = value;
+            }
+            this._board.setGridFromArray(grid);
+        }
+
+        const passed = new Set(delta.passed_player_indices);
+        this._players.forEach((player, index) => {
+            player.hasPassed = passed.has(index);
+            player.status = delta.player_statuses[index];
+        });
+
+        this._finishServerSync(delta);
+    }
+
+    /**
+     * Apply turn/status fields shared by full states and deltas, then resume play
+     * @param {Object} serverState - GameState or GameStateDelta
+     * @private
+     */
+    _finishServerSync(serverState) {
         // Update current player
         this._currentPlayer = serverState.current_player_id;
 
@@ -7,10 +7,18 @@ to make it available for the web interface.
 """
 
 import json
+import os
 import argparse
 from pathlib import Path
 from typing import Optional
 
+# Default tags by board size (14 = Duo, 20 = Standard)
+DEFAULT_TAGS = {
+    14: ("expert", "duo-only", "slow"),
+    20: ("expert", "standard-only", "slow"),
+}
+FALLBACK_TAGS = ("expert",)
+
 
 def update_registry(
     registry_path: Path,
@@ -52,12 +60,7 @@ def update_registry(
     
     # Default tags based on board size
     if tags is None:
-        if board_size == 14:
-            tags = ["expert", "duo-only", "slow"]
-        elif board_size == 20:
-            tags = ["expert", "standard-only", "slow"]
-        else:
-            tags = ["expert"]
+        tags = list(DEFAULT_TAGS.get(board_size, FALLBACK_TAGS))
     
     # Create new model entry
     new_entry = {
@@ -93,9 +96,12 @@ def update_registry(
         registry.append(new_entry)
         print(f"✅ Added model '{model_id}' to registry")
     
-    # Save registry
-    with open(registry_path, 'w', encoding='utf-8') as f:
+    # Save registry: write a sibling temp file, then swap it in atomically so
+    # a running server never reads a half-written registry
+    tmp_path = registry_path.with_suffix('.json.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
         json.dump(registry, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, registry_path)
     
     print(f"📝 Registry saved to {registry_path}")
 